@@ -0,0 +1,303 @@
+"""
+Admission control for LLM calls: a global concurrency and token-rate budget,
+with priority classes and per-user fair queuing in front of it.
+
+    async with admission.admit(user_id, priority, est_tokens) as ticket:
+        msg = await client.messages.create(...)
+        ticket.used_tokens = msg.usage.input_tokens + msg.usage.output_tokens
+
+- Waiters are served highest priority first (HIGH before NORMAL before LOW);
+  within a class, users take turns (round robin), so one rep's burst queues
+  behind itself instead of in front of everyone else.
+- A call is admitted only when a concurrency slot is free and the token
+  bucket (tokens_per_minute, refilled continuously) covers its estimate. The
+  estimate is settled against actual usage on release.
+- The queue is bounded, overall and per user (callers without a user id
+  share ANONYMOUS, which has no per-user cap). A full queue sheds the newest
+  waiter of a lower class (from the user with the most waiters) to make room
+  for higher-priority work; otherwise, or when a waiter's queue deadline
+  passes, admit() raises AdmissionRejected with a Retry-After hint, so
+  callers can back off quickly instead of piling onto the provider's limit.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+HIGH = 0
+NORMAL = 1
+LOW = 2
+PRIORITY_NAMES = {HIGH: "high", NORMAL: "normal", LOW: "low"}
+# Queue key for calls without a user id. Unrelated callers share it, so the
+# per-user cap does not apply to it.
+ANONYMOUS = "anonymous"
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Ticket:
+    __slots__ = ("user", "priority", "tokens", "used_tokens", "future", "enqueued")
+
+    def __init__(self, user: str, priority: int, tokens: int) -> None:
+        self.user = user
+        self.priority = priority
+        self.tokens = tokens
+        self.used_tokens: Optional[int] = None  # set by the caller after the call
+        self.future: Optional["asyncio.Future[None]"] = None
+        self.enqueued = time.monotonic()
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrency: int,
+        tokens_per_minute: int = 0,
+        max_queue: int = 256,
+        queue_timeout_s: float = 10.0,
+        max_queue_per_user: Optional[int] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        # One user may hold at most this many queued waiters (all classes).
+        self.max_queue_per_user = max_queue_per_user or max(1, max_queue // 8)
+        self._queued_by_user: Dict[str, int] = {}
+        self.in_flight = 0
+        # One OrderedDict per priority class: user -> that user's waiters.
+        self._queues: List["OrderedDict[str, Deque[Ticket]]"] = [OrderedDict() for _ in PRIORITY_NAMES]
+        self._depth = 0
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._service_s = 5.0  # EWMA of call duration, for Retry-After
+        self.counters: Dict[str, int] = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_user_share": 0,
+            "shed": 0,
+            "rejected_deadline": 0,
+        }
+        self._wait_ms: Dict[int, Deque[float]] = {p: deque(maxlen=1024) for p in PRIORITY_NAMES}
+
+    # Token bucket
+
+    def _refill(self) -> None:
+        if self.tokens_per_minute <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.tokens_per_minute),
+            self._tokens + (now - self._refilled_at) * self.tokens_per_minute / 60.0,
+        )
+        self._refilled_at = now
+
+    def _tokens_short(self, tokens: int) -> float:
+        """Tokens still missing before `tokens` can be spent (0 if affordable)."""
+        if self.tokens_per_minute <= 0:
+            return 0.0
+        # A call larger than the whole bucket runs once the bucket is full.
+        return max(0.0, min(tokens, self.tokens_per_minute) - self._tokens)
+
+    # Queue
+
+    def _peek(self) -> Optional[Ticket]:
+        for queue in self._queues:
+            if queue:
+                return next(iter(queue.values()))[0]
+        return None
+
+    def _enqueue(self, ticket: Ticket) -> None:
+        self._queues[ticket.priority].setdefault(ticket.user, deque()).append(ticket)
+        self._queued_by_user[ticket.user] = self._queued_by_user.get(ticket.user, 0) + 1
+        self._depth += 1
+
+    def _dequeued(self, ticket: Ticket) -> None:
+        self._depth -= 1
+        left = self._queued_by_user[ticket.user] - 1
+        if left:
+            self._queued_by_user[ticket.user] = left
+        else:
+            del self._queued_by_user[ticket.user]
+
+    def _pop(self, ticket: Ticket) -> None:
+        queue = self._queues[ticket.priority]
+        waiters = queue[ticket.user]
+        waiters.popleft()
+        if waiters:
+            queue.move_to_end(ticket.user)  # next user's turn
+        else:
+            del queue[ticket.user]
+        self._dequeued(ticket)
+
+    def _remove(self, ticket: Ticket) -> None:
+        queue = self._queues[ticket.priority]
+        waiters = queue.get(ticket.user)
+        if waiters is not None and ticket in waiters:
+            waiters.remove(ticket)
+            if not waiters:
+                del queue[ticket.user]
+            self._dequeued(ticket)
+
+    def _shed_below(self, priority: int) -> bool:
+        """Drop the newest waiter of the lowest class below `priority`; False if none."""
+        for p in range(len(self._queues) - 1, priority, -1):
+            queue = self._queues[p]
+            if not queue:
+                continue
+            user = max(queue, key=lambda u: len(queue[u]))
+            victim = queue[user][-1]
+            self._remove(victim)
+            self.counters["shed"] += 1
+            assert victim.future is not None
+            victim.future.set_exception(
+                AdmissionRejected("Shed for higher-priority LLM work", self.retry_after())
+            )
+            return True
+        return False
+
+    def _grant(self, ticket: Ticket) -> None:
+        self.in_flight += 1
+        if self.tokens_per_minute > 0:
+            self._tokens -= ticket.tokens
+        self.counters["admitted"] += 1
+        self._wait_ms[ticket.priority].append((time.monotonic() - ticket.enqueued) * 1000)
+
+    def _dispatch(self) -> None:
+        self._refill()
+        while self.in_flight < self.max_concurrency:
+            ticket = self._peek()
+            if ticket is None:
+                return
+            short = self._tokens_short(ticket.tokens)
+            if short > 0:
+                self._schedule_wakeup(short * 60.0 / self.tokens_per_minute)
+                return
+            self._pop(ticket)
+            self._grant(ticket)
+            assert ticket.future is not None
+            ticket.future.set_result(None)
+
+    def _schedule_wakeup(self, delay_s: float) -> None:
+        if self._wakeup is not None:
+            return
+
+        def wake() -> None:
+            self._wakeup = None
+            self._dispatch()
+
+        self._wakeup = asyncio.get_running_loop().call_later(delay_s, wake)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free, given the current queue."""
+        waves = (self._depth + 1) / max(1, self.max_concurrency)
+        return max(1, min(60, math.ceil(waves * self._service_s)))
+
+    # Public API
+
+    async def acquire(
+        self,
+        user: str,
+        priority: int,
+        tokens: int,
+        timeout_s: Optional[float] = None,
+    ) -> Ticket:
+        """Wait for admission; `timeout_s` (e.g. the request deadline) caps queue_timeout_s."""
+        ticket = Ticket(user, priority, tokens)
+        self._refill()
+        if self._depth == 0 and self.in_flight < self.max_concurrency and not self._tokens_short(tokens):
+            self._grant(ticket)
+            return ticket
+        if user != ANONYMOUS and self._queued_by_user.get(user, 0) >= self.max_queue_per_user:
+            self.counters["rejected_user_share"] += 1
+            raise AdmissionRejected("Too many queued LLM calls for this user", self.retry_after())
+        if self._depth >= self.max_queue and not self._shed_below(priority):
+            self.counters["rejected_queue_full"] += 1
+            raise AdmissionRejected("LLM queue full", self.retry_after())
+
+        ticket.future = asyncio.get_running_loop().create_future()
+        self._enqueue(ticket)
+        self.counters["queued"] += 1
+        self._dispatch()
+        try:
+            wait_s = self.queue_timeout_s if timeout_s is None else min(self.queue_timeout_s, timeout_s)
+            await asyncio.wait_for(asyncio.shield(ticket.future), wait_s)
+        except asyncio.TimeoutError:
+            if not ticket.future.done():
+                self._remove(ticket)
+                self.counters["rejected_deadline"] += 1
+                raise AdmissionRejected("LLM queue wait exceeded deadline", self.retry_after())
+            # Granted or shed in the same loop iteration as the timeout.
+            shed = ticket.future.exception()
+            if shed is not None:
+                raise shed
+        except asyncio.CancelledError:
+            if not ticket.future.done():
+                self._remove(ticket)
+            elif ticket.future.exception() is None:
+                self.release(ticket, 0.0)  # granted, but the caller went away
+            # else: shed, so it never held a slot
+            raise
+        return ticket
+
+    def release(self, ticket: Ticket, duration_s: float) -> None:
+        self.in_flight -= 1
+        if duration_s > 0:
+            self._service_s = 0.8 * self._service_s + 0.2 * duration_s
+        if self.tokens_per_minute > 0 and ticket.used_tokens is not None:
+            # Settle the estimate against what the call actually used.
+            self._tokens = min(float(self.tokens_per_minute), self._tokens + ticket.tokens - ticket.used_tokens)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        user: Optional[str],
+        priority: int,
+        tokens: int,
+        timeout_s: Optional[float] = None,
+    ) -> AsyncIterator[Ticket]:
+        ticket = await self.acquire(user or ANONYMOUS, priority, tokens, timeout_s)
+        started = time.monotonic()
+        try:
+            yield ticket
+        finally:
+            self.release(ticket, time.monotonic() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        def pct(samples: Deque[float], q: float) -> Optional[float]:
+            if not samples:
+                return None
+            ordered = sorted(samples)
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+        self._refill()
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self._depth,
+            "max_queue": self.max_queue,
+            "queue_timeout_s": self.queue_timeout_s,
+            "tokens_per_minute": self.tokens_per_minute,
+            "tokens_available": round(self._tokens) if self.tokens_per_minute > 0 else None,
+            **self.counters,
+            "classes": {
+                name: {
+                    "queued": sum(len(w) for w in self._queues[p].values()),
+                    "users_waiting": len(self._queues[p]),
+                    "wait_ms_p50": pct(self._wait_ms[p], 0.50),
+                    "wait_ms_p95": pct(self._wait_ms[p], 0.95),
+                }
+                for p, name in PRIORITY_NAMES.items()
+            },
+        }
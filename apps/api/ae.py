@@ -0,0 +1,133 @@
+"""
+Deterministic adverse-event (AE) trigger detection for transcripts.
+
+Python counterpart of `detectAe` in lib/ae.ts, extended with the SPEC §7.2
+`us_safety_min_info_v1` trigger_terms. Triggers, negations, global negative
+phrases and clause boundaries are compiled into one regex, so a transcript is
+scanned in a single linear pass:
+
+- triggers match as word prefixes ("hospitalization", "emergencies",
+  "seriously"), like the substring match in detectAe; only the short,
+  ambiguous "er" and "ae" must be whole words
+- a trigger preceded by a negation within NEGATION_WINDOW tokens, in the same
+  clause, is ignored ("no new rash", "denies hives")
+- a global negative phrase ("no side effects", "no adverse events") negates
+  like any other negation: within NEGATION_WINDOW tokens, in its clause.
+  lib/ae.ts instead clears the whole text on such a phrase, which misses
+  "No side effects last month, but yesterday she went to the ER"; this is an
+  intended divergence (see AE_EXAMPLES)
+"""
+from __future__ import annotations
+
+import re
+from typing import List, NamedTuple
+
+TRIGGERS = [
+    "hives",
+    "rash",
+    "urticaria",
+    "anaphylaxis",
+    "reaction",
+    "allergic",
+    "emergency",
+    "er",
+    "hospital",
+    "hospitalized",
+    "adverse event",
+    "ae",
+    "side effect",
+    "serious",
+]
+
+NEGATIONS = [
+    "no",
+    "denies",
+    "without",
+    "none",
+    "not",
+    "negative for",
+    "tolerating well",
+    "no new",
+]
+
+GLOBAL_NEGATIVE_PHRASES = ["no side effects", "no adverse events"]
+
+# Whole words only (plus plural): as prefixes they match "error", "aerosol".
+SHORT_TRIGGERS = ["er", "ae"]
+# Stems for triggers whose inflections drop the trigger's ending
+# ("emergencies", "anaphylactic").
+_TRIGGER_STEMS = {"emergency": "emergenc", "anaphylaxis": "anaphyla"}
+
+# Same window as lib/ae.ts: the trigger token and the 3 tokens before it.
+NEGATION_WINDOW = 3
+
+
+def _alternation(terms: List[str]) -> str:
+    # Longest first so "no new" wins over "no", "hospitalized" over "hospital".
+    ordered = sorted(terms, key=len, reverse=True)
+    return "|".join(re.escape(t).replace(r"\ ", r"\s+") for t in ordered)
+
+
+_STEMMED = sorted({_TRIGGER_STEMS.get(t, t) for t in TRIGGERS if t not in SHORT_TRIGGERS})
+_SCANNER = re.compile(
+    rf"\b(?:(?P<glob>{_alternation(GLOBAL_NEGATIVE_PHRASES)})"
+    rf"|(?P<neg>{_alternation(NEGATIONS)})"
+    rf"|(?P<trig>(?:{_alternation(_STEMMED)})\w*|(?:{_alternation(SHORT_TRIGGERS)})s?))\b"
+    r"|(?P<stop>[.;!?\n])",
+    re.IGNORECASE,
+)
+_WS = re.compile(r"\s+")
+
+
+def _tokens_between(text: str, start: int, end: int) -> int:
+    """Whole tokens strictly between two offsets."""
+    return max(0, len(_WS.findall(text, start, end)) - 1)
+
+
+class AeHit(NamedTuple):
+    term: str
+    start: int
+    end: int
+
+
+def scan_ae(text: str) -> List[AeHit]:
+    """Return non-negated AE trigger spans (empty if none)."""
+    hits: List[AeHit] = []
+    negation_end = -1  # end offset of the last negation in the current clause
+    for m in _SCANNER.finditer(text):
+        kind = m.lastgroup
+        if kind == "stop":
+            negation_end = -1
+        elif kind in ("glob", "neg"):
+            negation_end = m.end()
+        elif negation_end < 0 or _tokens_between(text, negation_end, m.start()) >= NEGATION_WINDOW:
+            hits.append(AeHit(m.group().lower(), m.start(), m.end()))
+    return hits
+
+
+def detect_ae(text: str) -> bool:
+    return bool(scan_ae(text))
+
+
+# Same examples as AE_EXAMPLES in lib/ae.ts, plus misses found in review.
+# "terms" are the non-negated triggers scan_ae must return, in order.
+# Entries with "ts_expected" are known, intended divergences from detectAe.
+AE_EXAMPLES = [
+    {"text": "No new side effects reported", "expected": False, "terms": []},
+    {"text": "The person had hives and went to the ER for evaluation", "expected": True, "terms": ["hives", "er"]},
+    {"text": "No adverse events", "expected": False, "terms": []},
+    {"text": "They went to emergency after the reaction", "expected": True, "terms": ["emergency", "reaction"]},
+    {"text": "No adverse events or reactions reported", "expected": False, "terms": []},
+    {
+        "text": "No side effects last month, but yesterday she went to the ER with anaphylaxis",
+        "expected": True,
+        "terms": ["er", "anaphylaxis"],
+        "ts_expected": False,
+    },
+    {"text": "She required hospitalization after the second dose", "expected": True, "terms": ["hospitalization"]},
+    {"text": "Two emergencies this month", "expected": True, "terms": ["emergencies"]},
+    {"text": "The patient was hospitalised", "expected": True, "terms": ["hospitalised"]},
+    {"text": "Seriously ill after the injection", "expected": True, "terms": ["seriously"]},
+    {"text": "Denies hives; no new rashes since the last visit", "expected": False, "terms": []},
+    {"text": "Other errors on the aerosol order form", "expected": False, "terms": []},
+]
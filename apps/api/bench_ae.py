@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Throughput check for ae.scan_ae on transcript-sized text (~100 KB).
+
+    python bench_ae.py [--size-kb 100] [--runs 20]
+
+Prints MB/s and per-transcript latency for a transcript without AE talk, one
+with frequent negated mentions ("no new rash", "denies hives") and one with
+real triggers, plus a check over AE_EXAMPLES.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from ae import AE_EXAMPLES, scan_ae
+
+PLAIN = (
+    "Discussed the dosing schedule with Dr. Patel and reviewed the coverage checklist for the practice. "
+    "She asked about formulary access, prior authorization turnaround and samples for the clinic next quarter. "
+)
+NEGATED = (
+    "Most patients are tolerating well with no new rash and no side effects this month. "
+    "The nurse denies hives or any reaction after the second dose; no adverse events were logged. "
+)
+TRIGGERS = (
+    "One patient developed hives after the injection and went to the ER that evening. "
+    "She required hospitalization for a serious allergic reaction; the office will report the adverse event. "
+)
+
+
+def transcript(sample: str, size_kb: int) -> str:
+    return (sample * (size_kb * 1024 // len(sample) + 1))[: size_kb * 1024]
+
+
+def throughput(text: str, runs: int) -> tuple[float, float]:
+    """(MB/s, ms per transcript) for the best run."""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        scan_ae(text)
+        best = min(best, time.perf_counter() - started)
+    return len(text.encode("utf-8")) / best / 1e6, best * 1000
+
+
+def check_examples() -> int:
+    """Number of AE_EXAMPLES whose triggers differ from the expected ones."""
+    return sum(
+        1 for example in AE_EXAMPLES if [hit.term for hit in scan_ae(example["text"])] != example["terms"]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure scan_ae throughput")
+    parser.add_argument("--size-kb", type=int, default=100, help="Transcript size in KB (default 100)")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs; the best one is reported (default 20)")
+    args = parser.parse_args()
+
+    for label, sample in (("plain", PLAIN), ("negated", NEGATED), ("triggers", TRIGGERS)):
+        text = transcript(sample, args.size_kb)
+        rate, ms = throughput(text, args.runs)
+        print(f"{label:<9} {len(text) // 1024:4d} KB  {rate:6.1f} MB/s  {ms:6.2f} ms/transcript")
+    print(f"examples  {len(AE_EXAMPLES)} checked, {check_examples()} mismatched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tail latency of hedged /precall model calls against a simulated Anthropic.
+
+    python bench_hedge.py [--hedge both|on|off] [--waves 25] [--wave-size 20]
+
+The fake client answers in 30-70 ms, except for --tail-rate of calls that
+take 0.5-2 s (seeded, so runs are comparable). Each mode warms the route's
+latency window, then fires --waves bursts of --wave-size concurrent
+_claude_json("precall") calls and prints p50/p95/p99/max and _hedge_stats.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from types import SimpleNamespace
+from typing import List
+
+# Before importing main: a key so the (fake) client is used, and enough
+# admission slots that queueing doesn't hide the model latency.
+os.environ.setdefault("ANTHROPIC_API_KEY", "bench")
+os.environ.setdefault("LLM_MAX_CONCURRENCY", "64")
+
+import main as api  # noqa: E402
+
+BODY = json.dumps({"call_objective_suggestions": [], "last_interaction_summary": "x", "questions_to_ask": []})
+WARMUP = 40
+
+
+class FakeMessages:
+    def __init__(self, rng: random.Random, tail_rate: float) -> None:
+        self.rng = rng
+        self.tail_rate = tail_rate
+
+    async def create(self, **kwargs):
+        slow = self.rng.random() < self.tail_rate
+        await asyncio.sleep(self.rng.uniform(0.5, 2.0) if slow else self.rng.uniform(0.03, 0.07))
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=BODY)],
+            stop_reason="end_turn",
+            usage=SimpleNamespace(input_tokens=10, output_tokens=10),
+        )
+
+
+class FakeClient:
+    def __init__(self, rng: random.Random, tail_rate: float) -> None:
+        self.messages = FakeMessages(rng, tail_rate)
+
+    def with_options(self, **kwargs) -> "FakeClient":
+        return self
+
+
+async def one(i: int) -> float:
+    started = time.perf_counter()
+    await api._claude_json("bench", f"call {i}", "precall", use_cache=False)
+    return (time.perf_counter() - started) * 1000
+
+
+async def run(hedge: bool, args: argparse.Namespace) -> None:
+    api._client = FakeClient(random.Random(args.seed), args.tail_rate)
+    api.router._stats.clear()
+    api.LLM_HEDGE_TASKS.clear()
+    if hedge:
+        api.LLM_HEDGE_TASKS.add("precall")
+    for key in api._hedge_stats:
+        api._hedge_stats[key] = 0
+
+    for i in range(WARMUP):
+        await one(-i)
+    latencies: List[float] = []
+    for wave in range(args.waves):
+        latencies += await asyncio.gather(*(one(wave * args.wave_size + i) for i in range(args.wave_size)))
+    latencies.sort()
+
+    def pct(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    stats = api._hedge_stats
+    extra = stats["hedged"] / len(latencies) * 100
+    print(
+        f"hedge={'on ' if hedge else 'off'} n={len(latencies)}  p50 {pct(0.50):5.0f} ms  p95 {pct(0.95):5.0f} ms  "
+        f"p99 {pct(0.99):5.0f} ms  max {latencies[-1]:5.0f} ms  "
+        f"hedged {stats['hedged']} ({extra:.0f}% extra calls), hedge won {stats['hedge_wins']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure hedged /precall tail latency")
+    parser.add_argument("--hedge", choices=("both", "on", "off"), default="both", help="Modes to run (default both)")
+    parser.add_argument("--waves", type=int, default=25, help="Bursts of concurrent calls (default 25)")
+    parser.add_argument("--wave-size", type=int, default=20, help="Concurrent calls per burst (default 20)")
+    parser.add_argument("--tail-rate", type=float, default=0.04, help="Share of slow (0.5-2 s) calls (default 0.04)")
+    parser.add_argument("--seed", type=int, default=7, help="Latency RNG seed (default 7)")
+    args = parser.parse_args()
+
+    # Without the anthropic package main.py leaves AsyncAnthropic as None and
+    # would fall back to its stub; any non-None value enables the client.
+    api.AsyncAnthropic = api.AsyncAnthropic or object
+    modes = {"both": (False, True), "on": (True,), "off": (False,)}[args.hedge]
+    for hedge in modes:
+        asyncio.run(run(hedge, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Throughput check for redact.py (target: 50 MB/s on transcript-sized text).
+
+    python bench_redact.py [--repeat 20000] [--runs 3]
+
+Prints MB/s for prose without identifiers, prose that mentions patients
+often (every sentence hits a context keyword), and a transcript with real
+identifiers, plus a precision/recall check over REDACTION_EXAMPLES.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from redact import REDACTION_EXAMPLES, StreamRedactor, find_phi, redact
+
+PLAIN = (
+    "Discussed the dosing schedule with Dr. Patel and reviewed the coverage checklist for the practice. "
+    "She asked about formulary access, prior authorization turnaround and samples for the clinic next quarter. "
+)
+PATIENT_HEAVY = (
+    "Discussed the dosing schedule with Dr. Patel and reviewed the coverage checklist for the practice. "
+    "She mentioned that most of her patients are tolerating therapy well and asked about the patient support program. "
+)
+WITH_IDENTIFIERS = (
+    "Office manager asked us to call (416) 555-0199 or email frontdesk@clinic.com about the PA. "
+    "Patient John Smith, DOB: 03/14/1962, MRN: A123456 was discussed; member id 1234567890. "
+    "Follow up on 2026-02-27 about the Patient Support Program enrollment. "
+)
+
+
+def throughput(text: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        redact(text)
+        best = min(best, time.perf_counter() - started)
+    return len(text.encode("utf-8")) / best / 1e6
+
+
+def stream_throughput(text: str, runs: int, chunk: int = 4096) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        stream = StreamRedactor()
+        for i in range(0, len(text), chunk):
+            stream.feed(text[i : i + chunk])
+        stream.close()
+        best = min(best, time.perf_counter() - started)
+    return len(text.encode("utf-8")) / best / 1e6
+
+
+def check_examples() -> tuple[int, int, int]:
+    """(true positives, false positives, false negatives) over REDACTION_EXAMPLES."""
+    tp = fp = fn = 0
+    for example in REDACTION_EXAMPLES:
+        expected = list(example["expected"])
+        for span in find_phi(example["text"]):
+            if span.kind in expected:
+                expected.remove(span.kind)
+                tp += 1
+            else:
+                fp += 1
+        fn += len(expected)
+    return tp, fp, fn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure redact.py throughput")
+    parser.add_argument("--repeat", type=int, default=20000, help="Sentence pairs per corpus (default 20000)")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs; the best one is reported (default 3)")
+    args = parser.parse_args()
+
+    for label, sample in (("plain", PLAIN), ("patient-heavy", PATIENT_HEAVY), ("identifiers", WITH_IDENTIFIERS)):
+        text = sample * args.repeat
+        print(
+            f"{label:<14} {len(text) / 1e6:6.1f} MB  "
+            f"redact {throughput(text, args.runs):6.1f} MB/s  "
+            f"stream {stream_throughput(text, args.runs):6.1f} MB/s"
+        )
+    tp, fp, fn = check_examples()
+    print(f"examples       tp={tp} fp={fp} fn={fn}")
+
+
+if __name__ == "__main__":
+    main()
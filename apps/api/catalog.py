@@ -0,0 +1,119 @@
+"""
+Server-side registry of MLR product catalogs, keyed by catalog_version.
+
+Catalogs (the `mlr_seed_v0.1` shape in SPEC.md §6.1) are validated once on
+load and indexed by product_id, HCP specialty and material_id, so requests
+can reference a catalog_version instead of uploading the whole catalog.
+
+The registry is copy-on-write: loading or reloading builds a new mapping and
+swaps it in with one assignment, so in-flight requests keep the snapshot they
+already resolved and never see a half-loaded catalog.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CatalogMaterial(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    material_id: str
+    title: Optional[str] = None
+    source: Optional[str] = None
+
+
+class CatalogProduct(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    product_id: str
+    brand_name: str
+    hcp_specialties: List[str] = []
+    materials: List[CatalogMaterial] = []
+
+
+class ProductCatalog(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    catalog_version: str
+    last_updated: Optional[str] = None
+    products: List[CatalogProduct]
+
+
+class CatalogSnapshot:
+    """One validated catalog version plus its lookup indexes."""
+
+    def __init__(self, catalog: ProductCatalog) -> None:
+        self.version = catalog.catalog_version
+        self.last_updated = catalog.last_updated
+        # Plain dicts as sent to the model; built once, shared read-only.
+        self.raw: Dict[str, Any] = catalog.model_dump(exclude_none=True)
+        products = self.raw["products"]
+        self.by_product_id: Dict[str, Dict[str, Any]] = {p["product_id"]: p for p in products}
+        self.by_specialty: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_material_id: Dict[str, Dict[str, Any]] = {}
+        for p in products:
+            for spec in p.get("hcp_specialties") or []:
+                self.by_specialty.setdefault(spec.lower(), []).append(p)
+            for m in p.get("materials") or []:
+                self.by_material_id[m["material_id"]] = {**m, "product_id": p["product_id"]}
+
+    @property
+    def products(self) -> List[Dict[str, Any]]:
+        return self.raw["products"]
+
+    def select(
+        self,
+        specialty: Optional[str] = None,
+        product_ids: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """Products for a specialty and/or explicit product ids, in catalog order."""
+        wanted = {pid for pid in product_ids if pid in self.by_product_id}
+        for p in self.by_specialty.get((specialty or "").lower(), []):
+            wanted.add(p["product_id"])
+        return [p for p in self.products if p["product_id"] in wanted]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "catalog_version": self.version,
+            "last_updated": self.last_updated,
+            "products": len(self.by_product_id),
+            "materials": len(self.by_material_id),
+        }
+
+
+class CatalogRegistry:
+    def __init__(self, catalog_dir: Optional[str] = None) -> None:
+        self.catalog_dir = Path(catalog_dir) if catalog_dir else None
+        self._versions: Dict[str, CatalogSnapshot] = {}
+
+    def get(self, version: str) -> Optional[CatalogSnapshot]:
+        return self._versions.get(version)
+
+    def versions(self) -> List[Dict[str, Any]]:
+        return [snap.summary() for snap in self._versions.values()]
+
+    def register(self, raw: Dict[str, Any]) -> CatalogSnapshot:
+        """Validate, index and publish one catalog version (replacing any previous one)."""
+        snapshot = CatalogSnapshot(ProductCatalog.model_validate(raw))
+        self._versions = {**self._versions, snapshot.version: snapshot}
+        return snapshot
+
+    def reload(self) -> List[str]:
+        """
+        Re-read every *.json catalog in catalog_dir and publish them together.
+        Versions registered through the API and not on disk are kept.
+        Raises (and publishes nothing) if any file fails validation.
+        """
+        if self.catalog_dir is None or not self.catalog_dir.is_dir():
+            return []
+        loaded: Dict[str, CatalogSnapshot] = {}
+        for path in sorted(self.catalog_dir.glob("*.json")):
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            snapshot = CatalogSnapshot(ProductCatalog.model_validate(raw))
+            loaded[snapshot.version] = snapshot
+        self._versions = {**self._versions, **loaded}
+        return list(loaded)
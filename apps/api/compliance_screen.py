@@ -0,0 +1,150 @@
+"""
+Rule-based compliance pre-screen run before the /compliance_review model call.
+
+Python counterpart of the PHI_MARKERS / OFF_LABEL_LIKE checks in
+lib/concierge/agents/compliance.ts. A draft with a high-confidence problem
+is rejected locally with structured issues, so the model only sees drafts
+the rules cannot decide:
+
+- high: an identifier that comes with patient context (DOB, MRN, SSN,
+  patient name; redact.find_phi span), or an off-label phrase ("off-label",
+  "unapproved use") in a sentence with no negation or deflection; "No
+  off-label discussion occurred" and "asked about off-label use; rep
+  declined and referred to Medical Information" are how reps are trained
+  to write it, so those are medium
+- medium: an email, phone number or long digit run, a PHI marker word, or a
+  phrase that is often negated ("not approved for", "prescribe for");
+  reported, but the draft is still escalated
+
+Only content fields of the drafted call report are screened: ids
+(event_id, draft_id, call_report_id, ...) are skipped, and the HCP office
+email/phone asked for in reporter_contact (SPEC §7.2) is expected there.
+The transcript is raw capture and is redacted before the model sees it.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+from redact import find_phi
+
+PHI_MARKERS = ["patient", "dob", "date of birth", "mrn", "ssn", "social security", "medical record"]
+OFF_LABEL_LIKE = ["off-label", "off label", "unapproved use"]
+# Ambiguous on their own ("prescribe for adults" is on-label, "not approved
+# for children" is usually the rep stating the label); left to the model.
+OFF_LABEL_AMBIGUOUS = ["prescribe for", "prescribing for", "indication not approved", "not approved for"]
+# In the same sentence as an off-label phrase, these mean it was denied or
+# deflected rather than discussed.
+DEFLECTIONS = [
+    "no", "not", "never", "none", "without", "declined", "refused", "deferred",
+    "redirected", "referred", "medical information",
+]
+# find_phi kinds that identify a patient; the rest may be an office contact.
+PATIENT_IDENTIFIERS = {"dob", "mrn", "ssn", "name"}
+# Ids and references, not content written by the rep.
+_NON_CONTENT_KEYS = {"event_id", "draft_id", "call_report_id", "expense_id", "hcp_id", "idempotency_key"}
+# Fields where an office email / phone number is the requested answer.
+_CONTACT_KEYS = {"reporter_contact"}
+
+
+def _alternation(terms: List[str]) -> str:
+    ordered = sorted(terms, key=len, reverse=True)
+    return "|".join(re.escape(t).replace(r"\ ", r"\s+").replace(r"\-", r"[\s-]?") for t in ordered)
+
+
+_SCANNER = re.compile(
+    rf"\b(?:(?P<off_label>{_alternation(OFF_LABEL_LIKE)})"
+    rf"|(?P<off_label_maybe>{_alternation(OFF_LABEL_AMBIGUOUS)})"
+    rf"|(?P<phi_marker>{_alternation(PHI_MARKERS)}))\b",
+    re.IGNORECASE,
+)
+
+
+_DEFLECTION = re.compile(rf"\b(?:{_alternation(DEFLECTIONS)})\b|n't\b", re.IGNORECASE)
+_SENTENCE_END = re.compile(r"[.!?\n]")
+
+
+def _sentence(text: str, start: int, end: int) -> str:
+    """The sentence around text[start:end]."""
+    before = max((m.end() for m in _SENTENCE_END.finditer(text, 0, start)), default=0)
+    after = _SENTENCE_END.search(text, end)
+    return text[before : after.start() if after else len(text)]
+
+
+class ScreenResult(NamedTuple):
+    issues: List[Dict[str, str]]
+    short_circuit: bool  # True if the rules alone decide the review
+
+    def verdict(self) -> Dict[str, Any]:
+        """ComplianceVerdict JSON for a short-circuited review."""
+        return {
+            "is_compliant_to_submit": False,
+            "issues": self.issues,
+            "required_edits": [i["detail"] for i in self.issues if i["severity"] == "high"],
+            "suggested_safe_rewrite": "",
+            "reviewed_by": "prescreen",
+        }
+
+
+def _fields(obj: Any, key: str = "") -> Iterator[Tuple[str, str]]:
+    """(nearest dict key, string) for every string in obj, minus id fields."""
+    if isinstance(obj, str):
+        yield key, obj
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            if k not in _NON_CONTENT_KEYS:
+                yield from _fields(v, str(k))
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from _fields(v, key)
+
+
+def screen(call_report: Dict[str, Any]) -> ScreenResult:
+    issues: List[Dict[str, str]] = []
+    seen = set()
+
+    def add(severity: str, type_: str, detail: str) -> None:
+        if detail not in seen:
+            seen.add(detail)
+            issues.append({"severity": severity, "type": type_, "detail": detail})
+
+    fields = list(_fields(call_report))
+    for key, value in fields:
+        for span in find_phi(value):
+            if span.kind in PATIENT_IDENTIFIERS:
+                add("high", "privacy", f"Patient identifier ({span.kind}) in call report. Remove it before submitting.")
+            elif key not in _CONTACT_KEYS:
+                add("medium", "privacy", f"Possible identifier ({span.kind}) in {key or 'call report'}. Keep only office contact details.")
+    text = "\n".join(value for _, value in fields)
+    for m in _SCANNER.finditer(text):
+        term = m.group().lower()
+        if m.lastgroup == "off_label" and _DEFLECTION.search(_sentence(text, m.start(), m.end())):
+            add("medium", "off_label", f'Off-label mention, apparently declined: "{term}". Confirm no off-label claim was made.')
+        elif m.lastgroup == "off_label":
+            add("high", "off_label", f'Content references off-label use: "{term}". Use only approved claims.')
+        elif m.lastgroup == "off_label_maybe":
+            add("medium", "off_label", f'Possible off-label discussion: "{term}". Check against approved indications.')
+        else:
+            add("medium", "patient_specific", f'Possible PHI marker: "{term}". Remove patient identifiers.')
+
+    return ScreenResult(issues, any(i["severity"] == "high" for i in issues))
+
+
+# Spot checks: whether each call report may be decided by the rules alone.
+SCREEN_EXAMPLES = [
+    {"call_report": {"notes_summary": "No off-label discussion occurred."}, "short_circuit": False},
+    {
+        "call_report": {
+            "notes_summary": "HCP asked about off-label use in children; rep declined and referred "
+            "the question to Medical Information."
+        },
+        "short_circuit": False,
+    },
+    {"call_report": {"notes_summary": "Discussed off-label use in pediatric patients."}, "short_circuit": True},
+    {"call_report": {"notes_summary": "Told them Dupixent is not approved for children under 6."}, "short_circuit": False},
+    {"call_report": {"notes_summary": "Patient John Smith, DOB: 03/14/1962, reported a rash."}, "short_circuit": True},
+    {
+        "call_report": {"call_report_id": "cr_2026_02_25_0001", "ae": {"reporter_contact": "(416) 555-0199"}},
+        "short_circuit": False,
+    },
+]
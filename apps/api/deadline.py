@@ -0,0 +1,53 @@
+"""
+Per-request deadlines, propagated through LLM and DB work via a contextvar.
+
+A client sends its remaining budget as `X-Request-Timeout-Ms` (or the server
+applies REQUEST_TIMEOUT_MS). Everything downstream asks how much is left:
+
+    deadline.bound(route.timeout_s)   # LLM timeout: min(profile, remaining)
+    deadline.remaining()              # None if the request has no deadline
+
+and raises DeadlineExceeded (504) instead of starting work that cannot
+finish in time.
+"""
+from __future__ import annotations
+
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+HEADER = "X-Request-Timeout-Ms"
+DEFAULT_TIMEOUT_MS = int(os.getenv("REQUEST_TIMEOUT_MS", "0"))
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def start(timeout_ms: Optional[int]) -> None:
+    """Set the deadline for the current request (None / <= 0: no deadline)."""
+    _deadline.set(time.monotonic() + timeout_ms / 1000 if timeout_ms and timeout_ms > 0 else None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left for the current request, or None if it has no deadline."""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def bound(timeout_s: float) -> float:
+    """timeout_s capped by the time left; raises DeadlineExceeded if none is."""
+    left = remaining()
+    if left is None:
+        return timeout_s
+    if left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(timeout_s, left)
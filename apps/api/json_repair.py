@@ -0,0 +1,113 @@
+"""
+Tolerant extraction of the JSON object in a model response.
+
+Models sometimes wrap the object in a ```json fence, add a sentence before or
+after it, or stop mid-object at max_tokens. extract_json() handles all three
+without another generation:
+
+    parsed = extract_json(text)   # -> Extracted(value, outcome) or None
+    parsed.outcome                # "clean" | "extracted" | "repaired"
+
+"repaired" means the object was truncated and has been closed: an open
+string is terminated, a dangling key / partial value is dropped back to the
+last complete member, and open arrays / objects are closed. Repaired output
+may be missing trailing fields; callers validate it against the task schema.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+
+# Cut points tried when closing a truncated object, newest first.
+_MAX_REPAIR_ATTEMPTS = 64
+
+
+class Extracted(NamedTuple):
+    value: Any
+    outcome: str
+
+
+def strip_fences(text: str) -> str:
+    m = _FENCE.search(text)
+    return m.group(1) if m else text
+
+
+def _scan(text: str, start: int) -> Tuple[Optional[int], List[Tuple[int, str]], str, bool]:
+    """
+    Walk the object starting at text[start] == "{".
+    Returns (end index of the matching "}" or None if truncated, cut points
+    as (index, closers) at each top-level-or-nested ",", closers needed at the
+    end of the text, whether the text ends inside a string).
+    """
+    stack: List[str] = []
+    cuts: List[Tuple[int, str]] = []
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+            continue
+        if c == '"':
+            in_string = True
+        elif c == "{":
+            stack.append("}")
+        elif c == "[":
+            stack.append("]")
+        elif c in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return i, cuts, "", False
+        elif c == ",":
+            cuts.append((i, "".join(reversed(stack))))
+    return None, cuts, "".join(reversed(stack)), in_string
+
+
+def _loads(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def extract_json(text: str) -> Optional[Extracted]:
+    """Best-effort JSON object from a model response; None if nothing usable."""
+    stripped = text.strip()
+    value = _loads(stripped)
+    if isinstance(value, dict):
+        return Extracted(value, "clean")
+
+    body = strip_fences(stripped)
+    start = body.find("{")
+    if start < 0:
+        return None
+    end, cuts, closers, in_string = _scan(body, start)
+    if end is not None:
+        value = _loads(body[start : end + 1])
+        return Extracted(value, "extracted") if isinstance(value, dict) else None
+
+    # Truncated: close what is open, else fall back to earlier member boundaries.
+    tail = body[start:].rstrip()
+    candidates = [tail + ('"' if in_string else "") + closers]
+    candidates += [body[start:i] + c for i, c in reversed(cuts[-_MAX_REPAIR_ATTEMPTS:])]
+    for candidate in candidates:
+        value = _loads(candidate)
+        if isinstance(value, dict):
+            return Extracted(value, "repaired")
+    return None
+
+
+def is_truncated(text: str) -> bool:
+    """True if the response opens a JSON object that never closes."""
+    body = strip_fences(text.strip())
+    start = body.find("{")
+    return start >= 0 and _scan(body, start)[0] is None
@@ -0,0 +1,119 @@
+"""
+Incremental parser for a JSON object arriving in chunks (e.g. streamed model
+output). Emits each top-level field as soon as its value closes, without
+waiting for the rest of the object.
+
+    parser = TopLevelFieldParser()
+    for chunk in chunks:
+        for key, value in parser.feed(chunk):
+            ...
+    obj = parser.result()
+
+Anything before the first "{" (prose, code fences) is ignored.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple
+
+# States while at depth 1 (directly inside the top-level object).
+_KEY = 0          # expecting a key (or "}")
+_COLON = 1        # key read, expecting ":"
+_VALUE_START = 2  # expecting the first character of a value
+_VALUE = 3        # inside a string / object / array value
+_SCALAR = 4       # inside a number / true / false / null
+_AFTER_VALUE = 5  # value emitted, expecting "," or "}"
+
+
+class TopLevelFieldParser:
+    def __init__(self) -> None:
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._state = _KEY
+        self._mark = 0
+        self._start = -1
+        self._end = -1
+        self._key: str = ""
+
+    def _emit(self, raw: str, out: List[Tuple[str, Any]]) -> None:
+        self._state = _AFTER_VALUE
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        self.fields[self._key] = value
+        out.append((self._key, value))
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume the next chunk; return top-level (key, value) pairs completed by it."""
+        out: List[Tuple[str, Any]] = []
+        begin = len(self.text)
+        self.text += chunk
+        t = self.text
+        for i in range(begin, len(t)):
+            if self.done:
+                break
+            c = t[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._state == _KEY:
+                            self._key = json.loads(t[self._mark : i + 1])
+                            self._state = _COLON
+                        elif self._state == _VALUE:
+                            self._emit(t[self._mark : i + 1], out)
+                continue
+
+            if self._depth == 0:
+                if c == "{":
+                    self._depth = 1
+                    self._state = _KEY
+                    self._start = i
+                continue
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._state in (_KEY, _VALUE_START):
+                    self._mark = i
+                    if self._state == _VALUE_START:
+                        self._state = _VALUE
+            elif c in "{[":
+                if self._depth == 1 and self._state == _VALUE_START:
+                    self._mark = i
+                    self._state = _VALUE
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._state == _VALUE:
+                    self._emit(t[self._mark : i + 1], out)
+                elif self._depth == 0:
+                    if self._state == _SCALAR:
+                        self._emit(t[self._mark : i].strip(), out)
+                    self._end = i
+                    self.done = True
+            elif self._depth == 1:
+                if c == ":" and self._state == _COLON:
+                    self._state = _VALUE_START
+                elif c == ",":
+                    if self._state == _SCALAR:
+                        self._emit(t[self._mark : i].strip(), out)
+                    self._state = _KEY
+                elif self._state == _VALUE_START and not c.isspace():
+                    self._mark = i
+                    self._state = _SCALAR
+        return out
+
+    def result(self) -> Dict[str, Any]:
+        """Parse the complete object; raises ValueError if it never closed."""
+        if not self.done:
+            raise ValueError("JSON object incomplete")
+        return json.loads(self.text[self._start : self._end + 1])
@@ -0,0 +1,299 @@
+"""
+Content-addressed cache for LLM JSON responses.
+
+Two tiers:
+- in-process LRU (bounded by entry count), per uvicorn worker
+- Postgres table llm_cache, shared by all workers
+
+Keys are a SHA-256 over (model, system prompt, canonicalized user JSON), so
+any change to a prompt template produces new keys. Rows written under an old
+template are dropped by invalidate_stale() at startup.
+
+The persistent tier never holds up a request for long: lookups are bounded
+by a short timeout (and skipped for a while after the table errors), and
+writes happen in the background. invalidate_task() bumps a per-task
+generation in llm_cache_generation; every worker polls it and drops its own
+in-memory entries for that task.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, Optional, Set, Tuple
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+
+def canonical_user(user: str) -> str:
+    """Re-serialize JSON prompts with sorted keys and no whitespace."""
+    try:
+        return json.dumps(json.loads(user), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return user
+
+
+def prompt_hash(template: str) -> str:
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(model: str, system: str, user: str) -> str:
+    material = json.dumps([model, system, canonical_user(user)], separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+ALL_TASKS = "*"
+
+
+class LLMCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttls: Dict[str, int],
+        default_ttl: int,
+        lookup_timeout_s: float = 0.25,
+        error_backoff_s: float = 5.0,
+        generation_check_s: float = 5.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.lookup_timeout_s = lookup_timeout_s
+        self.error_backoff_s = error_backoff_s
+        self.generation_check_s = generation_check_s
+        # key -> (task, expires_at, latency_ms, value)
+        self._lru: "OrderedDict[str, Tuple[str, float, int, Dict[str, Any]]]" = OrderedDict()
+        # Persistent tier is skipped until this time.monotonic() after an error.
+        self._persistent_down_until = 0.0
+        # task (or ALL_TASKS) -> last generation seen in llm_cache_generation
+        self._generations: Dict[str, int] = {}
+        self._generation_checked = 0.0
+        self._background: Set["asyncio.Task[None]"] = set()
+        self.counters: Dict[str, Any] = {
+            "hits_memory": 0,
+            "hits_persistent": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "persistent_errors": 0,
+            "persistent_timeouts": 0,
+            "persistent_skipped": 0,
+            "generation_invalidations": 0,
+            "latency_saved_ms": 0,
+        }
+
+    def ttl_for(self, task: str) -> int:
+        return self.ttls.get(task, self.default_ttl)
+
+    def _remember(self, key: str, task: str, expires_at: float, latency_ms: int, value: Dict[str, Any]) -> None:
+        self._lru[key] = (task, expires_at, latency_ms, value)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _forget_task(self, task: Optional[str]) -> None:
+        if task is None or task == ALL_TASKS:
+            self._lru.clear()
+            return
+        for key in [k for k, entry in self._lru.items() if entry[0] == task]:
+            del self._lru[key]
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _persistent_failed(self) -> None:
+        self.counters["persistent_errors"] += 1
+        self._persistent_down_until = time.monotonic() + self.error_backoff_s
+
+    async def _check_generations(self, pool: AsyncConnectionPool) -> None:
+        try:
+            async with pool.connection(timeout=self.lookup_timeout_s) as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("SELECT task, generation FROM llm_cache_generation")
+                    rows = await cur.fetchall()
+        except (psycopg.Error, PoolTimeout):
+            self._persistent_failed()
+            return
+        # A task missing from the table has never been invalidated: generation 0.
+        for task, generation in rows:
+            if self._generations.get(task, 0) != generation:
+                self._generations[task] = generation
+                self._forget_task(task)
+                self.counters["generation_invalidations"] += 1
+
+    def _maybe_check_generations(self, pool: AsyncConnectionPool) -> None:
+        now = time.monotonic()
+        if now - self._generation_checked >= self.generation_check_s:
+            self._generation_checked = now
+            self._spawn(self._check_generations(pool))
+
+    async def _lookup(self, pool: AsyncConnectionPool, key: str, timeout_s: float) -> Optional[Tuple[Any, ...]]:
+        async with pool.connection(timeout=timeout_s) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT task, response_json, latency_ms, EXTRACT(EPOCH FROM expires_at)
+                    FROM llm_cache
+                    WHERE cache_key = %s AND expires_at > NOW()
+                    """,
+                    (key,),
+                )
+                return await cur.fetchone()
+
+    async def get(
+        self,
+        pool: AsyncConnectionPool,
+        key: str,
+        timeout_s: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Memory tier, then the persistent tier within lookup_timeout_s. A slow
+        or failing persistent tier counts as a miss (and is skipped for
+        error_backoff_s); so does a caller whose timeout_s (remaining
+        deadline) is shorter than one lookup, without backing off.
+        """
+        self._maybe_check_generations(pool)
+        now = time.time()
+        entry = self._lru.get(key)
+        if entry is not None:
+            task, expires_at, latency_ms, value = entry
+            if expires_at > now:
+                self._lru.move_to_end(key)
+                self.counters["hits_memory"] += 1
+                self.counters["latency_saved_ms"] += latency_ms
+                return value
+            del self._lru[key]
+
+        row = None
+        if time.monotonic() < self._persistent_down_until:
+            self.counters["persistent_skipped"] += 1
+        elif timeout_s is not None and timeout_s < self.lookup_timeout_s:
+            # The caller can't wait a full lookup; that says nothing about
+            # the table, so no backoff.
+            self.counters["persistent_skipped"] += 1
+        else:
+            budget = self.lookup_timeout_s
+            try:
+                row = await asyncio.wait_for(self._lookup(pool, key, budget), budget)
+            except asyncio.TimeoutError:
+                self.counters["persistent_timeouts"] += 1
+                self._persistent_down_until = time.monotonic() + self.error_backoff_s
+            except (psycopg.Error, PoolTimeout):
+                self._persistent_failed()
+
+        if row is None:
+            self.counters["misses"] += 1
+            return None
+        task, value, latency_ms, expires_at = row[0], row[1], int(row[2] or 0), float(row[3])
+        self._remember(key, task, expires_at, latency_ms, value)
+        self.counters["hits_persistent"] += 1
+        self.counters["latency_saved_ms"] += latency_ms
+        return value
+
+    async def put(
+        self,
+        pool: AsyncConnectionPool,
+        key: str,
+        task: str,
+        template_hash: str,
+        value: Dict[str, Any],
+        latency_ms: int,
+    ) -> None:
+        """Store in memory now; the persistent write runs in the background."""
+        ttl = self.ttl_for(task)
+        if ttl <= 0:
+            return
+        self._remember(key, task, time.time() + ttl, latency_ms, value)
+        self.counters["stores"] += 1
+        if time.monotonic() >= self._persistent_down_until:
+            self._spawn(self._persist(pool, key, task, template_hash, value, latency_ms, ttl))
+
+    async def _persist(
+        self,
+        pool: AsyncConnectionPool,
+        key: str,
+        task: str,
+        template_hash: str,
+        value: Dict[str, Any],
+        latency_ms: int,
+        ttl: int,
+    ) -> None:
+        try:
+            async with pool.connection() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO llm_cache (cache_key, task, prompt_hash, response_json, latency_ms, expires_at)
+                    VALUES (%s, %s, %s, %s, %s, NOW() + make_interval(secs => %s))
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        response_json = EXCLUDED.response_json,
+                        latency_ms = EXCLUDED.latency_ms,
+                        created_at = NOW(),
+                        expires_at = EXCLUDED.expires_at
+                    """,
+                    (key, task, template_hash, json.dumps(value), latency_ms, ttl),
+                )
+        except (psycopg.Error, PoolTimeout):
+            self._persistent_failed()
+
+    async def invalidate_stale(
+        self,
+        pool: AsyncConnectionPool,
+        template_hashes: Dict[str, str],
+    ) -> int:
+        """Delete persistent rows written under a different prompt template, plus expired rows."""
+        self._lru.clear()
+        deleted = 0
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                for task, template_hash in template_hashes.items():
+                    await cur.execute(
+                        "DELETE FROM llm_cache WHERE task = %s AND prompt_hash <> %s",
+                        (task, template_hash),
+                    )
+                    deleted += cur.rowcount
+                await cur.execute("DELETE FROM llm_cache WHERE expires_at <= NOW()")
+                deleted += cur.rowcount
+        return deleted
+
+    async def invalidate_task(self, pool: AsyncConnectionPool, task: Optional[str] = None) -> int:
+        """
+        Drop every cached response for one task (or all tasks), here and, via
+        the generation bump, in every other worker's memory tier within
+        generation_check_s.
+        """
+        self._forget_task(task)
+        generation_key = task or ALL_TASKS
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                if task is None:
+                    await cur.execute("DELETE FROM llm_cache")
+                else:
+                    await cur.execute("DELETE FROM llm_cache WHERE task = %s", (task,))
+                deleted = cur.rowcount
+                await cur.execute(
+                    """
+                    INSERT INTO llm_cache_generation (task, generation) VALUES (%s, 1)
+                    ON CONFLICT (task) DO UPDATE SET
+                        generation = llm_cache_generation.generation + 1,
+                        updated_at = NOW()
+                    RETURNING generation
+                    """,
+                    (generation_key,),
+                )
+                row = await cur.fetchone()
+        if row is not None:
+            self._generations[generation_key] = row[0]
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "memory_entries": len(self._lru),
+            "max_entries": self.max_entries,
+            "ttls": self.ttls,
+        }
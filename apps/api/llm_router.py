@@ -0,0 +1,129 @@
+"""
+Per-task LLM routing: which model, max_tokens and timeout each endpoint uses,
+and when to escalate to a larger model.
+
+Each task has a RouteProfile. Tasks whose output is mostly extraction
+(expense, pre-call brief) default to a smaller model and escalate to
+ANTHROPIC_MODEL only when the smaller model's output cannot be parsed or
+fails the task's schema (schemas.py). Every setting can be overridden per task:
+
+    LLM_ROUTE_EXPENSE_MODEL=...          LLM_ROUTE_EXPENSE_MAX_TOKENS=800
+    LLM_ROUTE_EXPENSE_TIMEOUT_S=15       LLM_ROUTE_EXPENSE_ESCALATE_MODEL=...
+
+Set ..._ESCALATE_MODEL to an empty string to disable escalation for a task.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+from schemas import schema_problems
+
+DEFAULT_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest")
+SMALL_MODEL = os.getenv("ANTHROPIC_SMALL_MODEL", "claude-3-5-haiku-latest")
+
+
+class RouteProfile(NamedTuple):
+    model: str
+    max_tokens: int
+    timeout_s: float
+    escalate_model: Optional[str] = None
+    escalate_max_tokens: Optional[int] = None
+
+
+def _profile(task: str, model: str, max_tokens: int, timeout_s: float, escalate: Optional[str]) -> RouteProfile:
+    prefix = f"LLM_ROUTE_{task.upper()}_"
+    escalate_model = os.getenv(prefix + "ESCALATE_MODEL", escalate or "") or None
+    routed_model = os.getenv(prefix + "MODEL", model)
+    if escalate_model == routed_model:
+        escalate_model = None
+    routed_max_tokens = int(os.getenv(prefix + "MAX_TOKENS", str(max_tokens)))
+    return RouteProfile(
+        model=routed_model,
+        max_tokens=routed_max_tokens,
+        timeout_s=float(os.getenv(prefix + "TIMEOUT_S", str(timeout_s))),
+        escalate_model=escalate_model,
+        # The larger model gets more room, in case the first answer was truncated.
+        escalate_max_tokens=int(os.getenv(prefix + "ESCALATE_MAX_TOKENS", str(routed_max_tokens * 2))),
+    )
+
+
+ROUTES: Dict[str, RouteProfile] = {
+    "precall": _profile("precall", SMALL_MODEL, 1200, 20, DEFAULT_MODEL),
+    "callreport": _profile("callreport", DEFAULT_MODEL, 1500, 30, None),
+    "expense": _profile("expense", SMALL_MODEL, 800, 15, DEFAULT_MODEL),
+    "compliance": _profile("compliance", DEFAULT_MODEL, 1200, 30, None),
+}
+
+
+def output_problems(task: str, result: Any) -> List[str]:
+    """Reasons the output fails the task's schema (empty if it passes)."""
+    if not isinstance(result, dict):
+        return ["not a JSON object"]
+    return schema_problems(task, result)
+
+
+class RouteStats:
+    """Per (task, model) call counters, token usage and recent latencies."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0  # invalid JSON or schema problems
+        self.errors = 0  # API errors / timeouts
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency_ms: Deque[float] = deque(maxlen=1024)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.latency_ms)
+
+        def pct(q: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "errors": self.errors,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p95": pct(0.95),
+        }
+
+
+class Router:
+    def __init__(self, routes: Dict[str, RouteProfile]) -> None:
+        self.routes = routes
+        self._stats: Dict[str, RouteStats] = {}
+        self.requests: Dict[str, int] = {task: 0 for task in routes}
+        self.escalations: Dict[str, int] = {task: 0 for task in routes}
+
+    def route(self, task: str) -> RouteProfile:
+        return self.routes[task]
+
+    def stats(self, task: str, model: str) -> RouteStats:
+        key = f"{task}:{model}"
+        if key not in self._stats:
+            self._stats[key] = RouteStats()
+        return self._stats[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            task: {
+                "profile": profile._asdict(),
+                "requests": self.requests[task],
+                "escalations": self.escalations[task],
+                "escalation_rate": (
+                    round(self.escalations[task] / self.requests[task], 4) if self.requests[task] else None
+                ),
+                "models": {
+                    key.split(":", 1)[1]: stats.snapshot()
+                    for key, stats in self._stats.items()
+                    if key.split(":", 1)[0] == task
+                },
+            }
+            for task, profile in self.routes.items()
+        }
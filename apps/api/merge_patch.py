@@ -0,0 +1,23 @@
+"""
+JSON merge-patch (RFC 7396) for call drafts.
+
+    patched = apply_merge_patch(draft, {"next_steps": [...], "compliance": {"phi_detected": None}})
+
+Objects merge recursively, null deletes a key, and any other value (arrays
+included) replaces the target value. The input documents are not modified.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,159 @@
+"""
+Compact user-prompt builders for the LLM endpoints.
+
+Compared with json.dumps(payload.model_dump(), indent=2) the builders:
+- minify JSON (no indentation / separator whitespace)
+- drop None, empty strings, empty lists and empty objects
+- keep only catalog products / snippets relevant to the HCP or transcript
+- truncate call history to a token budget (most recent first)
+
+Token counts use a fast local estimate, not the provider tokenizer.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+PRECALL_HISTORY_TOKEN_BUDGET = int(os.getenv("PRECALL_HISTORY_TOKEN_BUDGET", "1500"))
+
+# Words split into ~4-char pieces, digits in groups of up to 3, and each
+# punctuation mark on its own: close to BPE counts for English + JSON.
+_TOKEN_RE = re.compile(r"[A-Za-z]{1,4}|\d{1,3}|[^\sA-Za-z\d]")
+
+
+class PromptBuild(BaseModel):
+    text: str
+    tokens: int
+    baseline_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.baseline_tokens - self.tokens)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_RE.findall(text))
+
+
+def minify(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def prune(obj: Any) -> Any:
+    """Recursively drop None, "", [] and {} values."""
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            v = prune(v)
+            if v is None or v == "" or v == [] or v == {}:
+                continue
+            out[k] = v
+        return out
+    if isinstance(obj, list):
+        items = [prune(v) for v in obj]
+        return [v for v in items if not (v is None or v == "" or v == [] or v == {})]
+    return obj
+
+
+def _baseline_tokens(raw: Dict[str, Any]) -> int:
+    return estimate_tokens(json.dumps(raw, indent=2))
+
+
+def _mentions(text: str, product: Dict[str, Any]) -> bool:
+    names = [product.get("brand_name"), product.get("generic_name"), product.get("product_id")]
+    return any(n and n != "PLACEHOLDER" and n.lower() in text for n in names if isinstance(n, str))
+
+
+def relevant_products(
+    products: Iterable[Dict[str, Any]],
+    specialty: Optional[str] = None,
+    text: Optional[str] = None,
+    product_ids: Iterable[str] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Products matching the HCP specialty, mentioned in the text, or explicitly
+    prioritized. Falls back to all products when nothing matches, so the model
+    is never left without the approved content.
+    """
+    products = list(products)
+    wanted = set(product_ids)
+    spec = (specialty or "").lower()
+    lowered = (text or "").lower()
+    keep = [
+        p
+        for p in products
+        if p.get("product_id") in wanted
+        or (spec and spec in [s.lower() for s in p.get("hcp_specialties") or []])
+        or (lowered and _mentions(lowered, p))
+    ]
+    return keep or products
+
+
+def truncate_to_budget(items: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+    """Keep the most recent items (by datetime_local, else list order) within a token budget."""
+    ordered = sorted(
+        items,
+        key=lambda r: str(r.get("datetime_local") or ""),
+        reverse=True,
+    ) if any("datetime_local" in r for r in items) else list(items)
+    kept: List[Dict[str, Any]] = []
+    used = 0
+    for item in ordered:
+        cost = estimate_tokens(minify(item))
+        if used + cost > budget:
+            break
+        kept.append(item)
+        used += cost
+    return kept
+
+
+def _build(raw: Dict[str, Any], compact: Dict[str, Any]) -> PromptBuild:
+    text = minify(prune(compact))
+    return PromptBuild(text=text, tokens=estimate_tokens(text), baseline_tokens=_baseline_tokens(raw))
+
+
+def build_precall_prompt(raw: Dict[str, Any]) -> PromptBuild:
+    hcp = raw.get("hcp_profile") or {}
+    compact = dict(raw)
+    compact["approved_product_snippets"] = relevant_products(
+        raw.get("approved_product_snippets") or [],
+        specialty=hcp.get("specialty"),
+        product_ids=raw.get("product_priorities") or [],
+    )
+    compact["last_call_reports"] = truncate_to_budget(
+        raw.get("last_call_reports") or [],
+        PRECALL_HISTORY_TOKEN_BUDGET,
+    )
+    return _build(raw, compact)
+
+
+def build_callreport_prompt(raw: Dict[str, Any]) -> PromptBuild:
+    compact = {k: v for k, v in raw.items() if k != "idempotency_key"}
+    # Status and follow-up questions are computed server-side (required_fields).
+    config = raw.get("required_fields_config")
+    if isinstance(config, dict):
+        compact["required_fields_config"] = {
+            k: v
+            for k, v in config.items()
+            if k not in ("missing_fields_question_templates", "max_questions_per_turn")
+        }
+    catalog = raw.get("product_catalog") or {}
+    if isinstance(catalog.get("products"), list):
+        text = " ".join([raw.get("transcript_text") or "", raw.get("extracted_text_from_image") or ""])
+        compact["product_catalog"] = {
+            **catalog,
+            "products": relevant_products(catalog["products"], text=text),
+        }
+    return _build(raw, compact)
+
+
+def build_expense_prompt(raw: Dict[str, Any]) -> PromptBuild:
+    return _build(raw, {k: v for k, v in raw.items() if k != "idempotency_key"})
+
+
+def build_compliance_prompt(raw: Dict[str, Any]) -> PromptBuild:
+    return _build(raw, raw)
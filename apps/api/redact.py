@@ -0,0 +1,261 @@
+"""
+Single-pass PHI/PII redaction for transcripts and OCR text (SPEC rule 4).
+
+Python counterpart of sanitizeText/checkForPhi in lib/conciergeSanitize.ts.
+Long digit runs, emails, phone numbers, SSNs, DOBs, MRNs and patient names
+are compiled into one scanner. Each alternative has exactly one named group:
+the span that gets redacted (context words such as "DOB:" or "patient" are
+kept). A name is one to three capitalized tokens right after "patient" /
+"pt" (or "patient name:", "named", "called"), none of them a program /
+material word ("Patient Support Program", "Patient Education" are not names).
+
+The scanner never runs over plain prose. Every match starts at a context
+keyword, at the start of an email's local part, or next to a digit; those
+anchors are found with str.find, the scanner is matched at keyword and email
+starts, and only searched over the short windows around digit runs.
+
+    result = redact(text)          # RedactionResult(text, spans)
+    stream = StreamRedactor()      # for long recordings fed in chunks
+    out = stream.feed(chunk) ... + stream.close()
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterator, List, NamedTuple, Tuple
+
+_DATE = (
+    r"\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"|(?i:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}"
+)
+
+# Capitalized words that follow "patient" in program and material names.
+_NOT_NAMES = [
+    "Access", "Advocate", "Assistance", "Brochure", "Care", "Center", "Education",
+    "Enrollment", "Form", "Guide", "Hub", "Information", "Journey", "Leaflet",
+    "Materials", "Navigator", "Patient", "Portal", "Program", "Programs", "Resources",
+    "Safety", "Savings", "Services", "Starter", "Support",
+]
+_NAME_TOKEN = rf"(?!(?:{'|'.join(_NOT_NAMES)})\b)[A-Z][a-z]+"
+
+_IDENTIFIERS = (
+    # Email; the lookbehind makes the local part start only at a token start.
+    r"(?<![\w.%+-])(?P<email>[\w.%+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,})"
+    # SSN before phone/digit runs so 123-45-6789 is labelled correctly.
+    r"|(?<!\d)(?P<ssn>\d{3}-\d{2}-\d{4})(?!\d)"
+    r"|(?<![\w+])(?P<phone>(?:\+?1[\s.-]?)?(?:\(\d{3}\)\s?|\d{3}[\s.-])\d{3}[\s.-]\d{4})(?!\d)"
+)
+# Between a DOB / MRN keyword and its value: "DOB: ", "MRN# ", "DOB is ",
+# "MRN was ".
+_LINK = r"(?:\s*[:#-]?\s*|\s+(?i:is|was)\s*:?\s*)"
+_IN_CONTEXT = (
+    rf"(?i:\b(?:dob|d\.o\.b\.|date\s+of\s+birth|born(?:\s+on)?)){_LINK}(?P<dob>{_DATE})"
+    rf"|(?i:\b(?:mrn|medical\s+record(?:\s+(?:number|no\.?))?)){_LINK}(?P<mrn>[A-Za-z]*\d[\w-]{{3,}})"
+)
+_NAME = (
+    # One to three capitalized tokens after "patient" / "pt", optionally with
+    # a cue ("patient name:", "named", "called", "patient:"); none of them
+    # may be a program / material word.
+    r"(?i:\b(?:patient(?:'s)?|pt\.?))"
+    r"(?:(?i:\s+name(?:\s+is)?\s*:?|\s+(?:is\s+)?(?:named|called)|\s*:)\s*|(?i:\s+is)?\s+)"
+    rf"(?P<name>{_NAME_TOKEN}(?:[ -]{_NAME_TOKEN}){{0,2}})\b"
+)
+_SCANNER = re.compile(
+    rf"{_IDENTIFIERS}|{_IN_CONTEXT}|(?<!\d)(?P<digits>\d{{8,}})(?!\d)|{_NAME}"
+)
+# The alternatives that start at a context keyword, matched at each keyword.
+_CONTEXT_SCANNER = re.compile(rf"{_IN_CONTEXT}|{_NAME}")
+
+# Context keywords (lowercase) that start the dob / mrn / name alternatives.
+_KEYWORDS = ("patient", "pt", "dob", "d.o.b", "date", "born", "mrn", "medical")
+# Keywords the scanner only accepts when not followed by a letter or digit.
+_WORD_KEYWORDS = frozenset(("patient", "pt", "date", "medical"))
+# Digits closer than this belong to one identifier ("(416) 555-0199").
+_DIGIT_GAP = 3
+# "+" / "(" before a phone's first digit.
+_DIGIT_LEAD = 2
+_LOCAL_PART_PUNCT = "_.%+-"
+
+# Chars held back between chunks so a match spanning a chunk boundary is seen
+# whole. Must exceed the longest context + value the scanner can need.
+STREAM_HOLDBACK = 96
+
+
+class Span(NamedTuple):
+    kind: str
+    start: int
+    end: int
+
+
+class RedactionResult(NamedTuple):
+    text: str
+    spans: List[Span]
+
+
+def _token(kind: str) -> str:
+    return f"[redacted-{kind}]"
+
+
+def _find_all(text: str, needle: str) -> Iterator[int]:
+    i = text.find(needle)
+    while i >= 0:
+        yield i
+        i = text.find(needle, i + 1)
+
+
+def _digit_windows(text: str) -> Iterator[Tuple[int, int]]:
+    """[lo, hi) around each cluster of digits."""
+    digits = sorted(i for d in "0123456789" for i in _find_all(text, d))
+    if not digits:
+        return
+    lo = prev = digits[0]
+    for i in digits[1:]:
+        if i - prev > _DIGIT_GAP:
+            yield max(0, lo - _DIGIT_LEAD), prev + 1
+            lo = i
+        prev = i
+    yield max(0, lo - _DIGIT_LEAD), prev + 1
+
+
+def _candidates(text: str) -> Iterator["re.Match[str]"]:
+    """Every scanner match that can start at an anchor, in no particular order."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some characters change length when lowercased; offsets don't line up.
+        yield from _SCANNER.finditer(text)
+        return
+    # Padded so the chars around a keyword can be read without bounds checks.
+    padded = f" {lowered} "
+    match = _CONTEXT_SCANNER.match
+    for keyword in _KEYWORDS:
+        after = len(keyword) + 1 if keyword in _WORD_KEYWORDS else 0
+        i = lowered.find(keyword)
+        while i >= 0:
+            before = padded[i]
+            # Every keyword alternative starts with \b; "patients" and
+            # "ptosis" can't match either.
+            if not (before.isalnum() or before == "_" or (after and padded[i + after].isalnum())):
+                m = match(text, i)
+                if m is not None:
+                    yield m
+            i = lowered.find(keyword, i + 1)
+    for at in _find_all(text, "@"):
+        start = at
+        while start > 0 and (text[start - 1].isalnum() or text[start - 1] in _LOCAL_PART_PUNCT):
+            start -= 1
+        m = _SCANNER.match(text, start)
+        if m is not None:
+            yield m
+    for lo, hi in _digit_windows(text):
+        yield from _SCANNER.finditer(text, lo, hi)
+
+
+def _scan(text: str) -> Iterator["re.Match[str]"]:
+    """Non-overlapping matches, leftmost (then longest) first."""
+    last_end = 0
+    for m in sorted(_candidates(text), key=lambda m: (m.start(), -m.end())):
+        if m.start() >= last_end:
+            last_end = m.end()
+            yield m
+
+
+def find_phi(text: str) -> List[Span]:
+    """Spans of detected identifiers, in order, without redacting."""
+    return [
+        Span(m.lastgroup, *m.span(m.lastgroup))  # type: ignore[arg-type]
+        for m in _scan(text)
+    ]
+
+
+def redact(text: str) -> RedactionResult:
+    spans: List[Span] = []
+    out: List[str] = []
+    pos = 0
+    for m in _scan(text):
+        kind = m.lastgroup
+        assert kind is not None
+        start, end = m.span(kind)
+        out.append(text[pos:start])
+        out.append(_token(kind))
+        spans.append(Span(kind, start, end))
+        pos = end
+    if not spans:
+        return RedactionResult(text, spans)
+    out.append(text[pos:])
+    return RedactionResult("".join(out), spans)
+
+
+class StreamRedactor:
+    """
+    Incremental redactor for text arriving in chunks. feed() returns the
+    redacted text that is final so far; close() flushes the rest. Span
+    offsets refer to the concatenated input.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._offset = 0  # input offset of _buf[0]
+        # Already-emitted input kept before _buf, so lookbehinds and \b at the
+        # cut see the same left context as a whole-text scan would.
+        self._context = ""
+        self.spans: List[Span] = []
+
+    def _drain(self, final: bool) -> str:
+        base = len(self._context)
+        text = self._context + self._buf
+        cut = len(text) if final else len(text) - STREAM_HOLDBACK
+        if cut <= base:
+            return ""
+        out: List[str] = []
+        pos = base
+        for m in _scan(text):
+            if m.start() < base:
+                continue  # decided by an earlier drain
+            if m.start() >= cut:
+                break
+            if not final and m.end() > cut:
+                # May still grow with the next chunk; keep it for later.
+                cut = m.start()
+                break
+            kind = m.lastgroup
+            assert kind is not None
+            start, end = m.span(kind)
+            out.append(text[pos:start])
+            out.append(_token(kind))
+            self.spans.append(Span(kind, self._offset + start - base, self._offset + end - base))
+            pos = end
+        out.append(text[pos:cut])
+        self._buf = text[cut:]
+        self._offset += cut - base
+        self._context = text[max(0, cut - STREAM_HOLDBACK) : cut]
+        return "".join(out)
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        return self._drain(final=False)
+
+    def close(self) -> str:
+        return self._drain(final=True)
+
+
+# Small labelled set for precision/recall spot checks: each example lists the
+# kinds that must be found; any other span is a false positive.
+REDACTION_EXAMPLES = [
+    {"text": "Patient John Smith, DOB: 03/14/1962, MRN: A123456.", "expected": ["name", "dob", "mrn"]},
+    {"text": "Call the office at (416) 555-0199 or email maya@clinic.com", "expected": ["phone", "email"]},
+    {"text": "Member id 1234567890 was on the PA form", "expected": ["digits"]},
+    {"text": "SSN 123-45-6789 was written on the fax", "expected": ["ssn"]},
+    {"text": "pt named Maria Lopez, born on Jan 5, 1980", "expected": ["name", "dob"]},
+    {"text": "Follow up on 2026-02-27 about PA rejections for Dupixent", "expected": []},
+    {"text": "Discussed patient support program and coverage checklist", "expected": []},
+    {"text": "Discussed Patient Support Program enrollment with the office", "expected": []},
+    {"text": "Left the Patient Education brochure and a pt Assistance form", "expected": []},
+    {"text": "Patient name: Ana Ruiz was mentioned by the nurse", "expected": ["name"]},
+    {"text": "Reviewed the patient Savings Card terms", "expected": []},
+    {"text": "Her DOB is 3/4/1950 per the chart", "expected": ["dob"]},
+    {"text": "MRN was A123456 on the fax", "expected": ["mrn"]},
+    {"text": "The patient Maria had a rash", "expected": ["name"]},
+    {"text": "Patient Jane called back", "expected": ["name"]},
+    {"text": "pt Smith asked about the copay card", "expected": ["name"]},
+    {"text": "Dr. Patel asked about dosing for a patient traveling abroad", "expected": []},
+]
@@ -0,0 +1,215 @@
+"""
+Local required-fields check for drafted call reports (SPEC §7.1).
+
+A `required_fields_config` (e.g. us_call_report_v1) is compiled once into a
+list of per-field check functions. Compiled configs are cached by config_id
+and reused for as long as the config sent with the request is unchanged, so
+a check is a handful of dict lookups:
+
+    validator = compile_config(config)
+    result = validator.validate(report)   # -> Validation
+    result.status        # required_fields_status, key -> complete|missing|invalid
+    result.questions     # up to max_questions_per_turn follow-up questions
+"""
+from __future__ import annotations
+
+import copy
+import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+COMPLETE = "complete"
+MISSING = "missing"
+INVALID = "invalid"
+
+# A check returns None when the value is acceptable, else MISSING or INVALID.
+Check = Callable[[Any], Optional[str]]
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _string_check(spec: Dict[str, Any]) -> Check:
+    min_len = int(spec.get("min_len") or 0)
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return INVALID
+        return INVALID if len(value.strip()) < min_len else None
+
+    return check
+
+
+def _enum_check(spec: Dict[str, Any]) -> Check:
+    values = frozenset(spec.get("values") or ())
+
+    def check(value: Any) -> Optional[str]:
+        return None if value in values else INVALID
+
+    return check
+
+
+def _array_check(spec: Dict[str, Any]) -> Check:
+    min_items = int(spec.get("min_items") or 0)
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, list):
+            return INVALID
+        # An empty list where items are required is still "missing" to the rep.
+        return MISSING if len(value) < min_items else None
+
+    return check
+
+
+def _parse_check(parse: Callable[[str], Any], spec: Dict[str, Any]) -> Check:
+    allow_unknown = bool(spec.get("allow_unknown"))
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return INVALID
+        if allow_unknown and value.strip().lower() == "unknown":
+            return None
+        try:
+            parse(value)
+        except ValueError:
+            return INVALID
+        return None
+
+    return check
+
+
+def _number_check(spec: Dict[str, Any]) -> Check:
+    minimum = spec.get("min")
+
+    def check(value: Any) -> Optional[str]:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return INVALID
+        return INVALID if minimum is not None and value < minimum else None
+
+    return check
+
+
+def _boolean_check(spec: Dict[str, Any]) -> Check:
+    must_be = spec.get("must_be")
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, bool):
+            return INVALID
+        return INVALID if must_be is not None and value is not must_be else None
+
+    return check
+
+
+_CHECK_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Check]] = {
+    "string": _string_check,
+    "enum": _enum_check,
+    "array": _array_check,
+    "datetime": lambda spec: _parse_check(datetime.datetime.fromisoformat, spec),
+    "date": lambda spec: _parse_check(datetime.date.fromisoformat, spec),
+    "number": _number_check,
+    "boolean": _boolean_check,
+}
+
+
+def _compile_field(spec: Dict[str, Any]) -> Tuple[str, Check]:
+    builder = _CHECK_BUILDERS.get(spec.get("type", "string"))
+    if builder is None:
+        # Unknown types only have to be present.
+        return spec["key"], lambda value: None
+    return spec["key"], builder(spec)
+
+
+class Validation(NamedTuple):
+    status: Dict[str, str]
+    missing: List[str]  # required fields not complete, in config order
+    compliance_failures: List[str]  # compliance checks whose must_be is violated
+    questions: List[str]
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing and not self.compliance_failures
+
+
+class CompiledConfig:
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config_id: Optional[str] = config.get("config_id")
+        self.fields = [_compile_field(f) for f in config.get("required_fields") or []]
+        # Only compliance checks with must_be can fail; the rest are informational.
+        self.compliance = [
+            _compile_field(c) for c in config.get("compliance_checks") or [] if "must_be" in c
+        ]
+        self.templates: Dict[str, str] = dict(
+            config.get("missing_fields_question_templates") or config.get("question_templates") or {}
+        )
+        self.max_questions = int(config.get("max_questions_per_turn") or 3)
+
+    def question(self, key: str) -> str:
+        return self.templates.get(key) or f"Can you provide the {key.replace('_', ' ')}?"
+
+    def validate(self, report: Dict[str, Any], keys: Optional[List[str]] = None) -> Validation:
+        """
+        Check a report against the config. `keys` limits the required-field
+        checks to those keys (e.g. the fields a patch touched).
+        """
+        fields = self.fields if keys is None else [(k, c) for k, c in self.fields if k in keys]
+        status: Dict[str, str] = {}
+        missing: List[str] = []
+        for key, check in fields:
+            value = report.get(key)
+            outcome = MISSING if _is_missing(value) else check(value)
+            status[key] = outcome or COMPLETE
+            if outcome:
+                missing.append(key)
+
+        compliance = report.get("compliance") or {}
+        failures = [
+            key
+            for key, check in self.compliance
+            if key in compliance and check(compliance[key]) is not None
+        ]
+        questions = [self.question(key) for key in missing[: self.max_questions]]
+        return Validation(status, missing, failures, questions)
+
+    def revalidate(
+        self,
+        report: Dict[str, Any],
+        previous: Dict[str, str],
+        keys: List[str],
+    ) -> Validation:
+        """
+        Incremental validate(): re-check only `keys` (and fields with no
+        previous status), keeping `previous` statuses for everything else.
+        """
+        recheck = set(keys) | {k for k, _ in self.fields if k not in previous}
+        partial = self.validate(report, [k for k, _ in self.fields if k in recheck])
+        status = {k: partial.status.get(k) or previous[k] for k, _ in self.fields}
+        missing = [k for k, s in status.items() if s != COMPLETE]
+        questions = [self.question(key) for key in missing[: self.max_questions]]
+        return Validation(status, missing, partial.compliance_failures, questions)
+
+
+# config_id -> (config as compiled, compiled validator). The stored copy is
+# compared with the incoming config, so an edited config recompiles.
+_compiled: Dict[str, Tuple[Dict[str, Any], CompiledConfig]] = {}
+_MAX_CACHED = 256
+_stats = {"compiles": 0, "hits": 0}
+
+
+def compile_config(config: Dict[str, Any]) -> CompiledConfig:
+    config_id = config.get("config_id")
+    if config_id is not None:
+        cached = _compiled.get(config_id)
+        if cached is not None and cached[0] == config:
+            _stats["hits"] += 1
+            return cached[1]
+    compiled = CompiledConfig(config)
+    _stats["compiles"] += 1
+    if config_id is not None:
+        if len(_compiled) >= _MAX_CACHED and config_id not in _compiled:
+            _compiled.clear()
+        _compiled[config_id] = (copy.deepcopy(config), compiled)
+    return compiled
+
+
+def compile_stats() -> Dict[str, Any]:
+    return {**_stats, "configs": sorted(_compiled)}
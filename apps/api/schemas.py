@@ -0,0 +1,96 @@
+"""
+Pydantic schemas for the JSON each LLM task must return (SPEC §4.2 / §5).
+
+They check the shape the API and the Snowflake loader rely on, not every
+field: extra keys are allowed, and optional fields may be absent. A model
+output that fails validation escalates to the larger model (llm_router) and
+is counted as a schema failure.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+class _Output(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class PrecallBrief(_Output):
+    hcp_id: Optional[str] = None
+    call_objective_suggestions: List[Any]
+    last_interaction_summary: str
+    open_loops: List[Any] = []
+    recommended_products_to_focus: List[Any] = []
+    compliance_reminders: List[Any] = []
+    questions_to_ask: List[Any]
+    materials_to_bring: List[Any] = []
+
+
+class CallReportCompliance(_Output):
+    phi_detected: Optional[bool] = None
+    patient_specific_advice_requested: Optional[bool] = None
+    adverse_event_mentioned: Optional[bool] = None
+    fair_balance_required: Optional[bool] = None
+
+
+class CallReport(_Output):
+    call_report_id: Optional[str] = None
+    call_objective: Optional[str] = None
+    products_discussed: List[Dict[str, Any]] = []
+    materials_shared: List[Any] = []
+    hcp_requests: List[Any] = []
+    next_steps: List[Any] = []
+    compliance: CallReportCompliance
+    notes_summary: str
+
+
+class ExpenseReport(_Output):
+    expense_id: Optional[str] = None
+    date: Optional[str] = None
+    # Unknown values are allowed; they show up in missing_fields instead.
+    category: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = None
+    attendees: List[Any] = []
+    business_purpose: Optional[str] = None
+    policy_flags: List[Any] = []
+    ready_to_submit: bool
+    missing_fields: List[Any] = []
+
+
+class ComplianceIssue(_Output):
+    severity: str
+    type: str
+    detail: str
+
+
+class ComplianceVerdict(_Output):
+    is_compliant_to_submit: bool
+    issues: List[ComplianceIssue]
+    required_edits: List[Any] = []
+    suggested_safe_rewrite: Optional[str] = None
+
+
+TASK_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "precall": PrecallBrief,
+    "callreport": CallReport,
+    "expense": ExpenseReport,
+    "compliance": ComplianceVerdict,
+}
+
+
+def schema_problems(task: str, value: Any) -> List[str]:
+    """Validation errors for a task's output as short strings (empty if valid)."""
+    schema = TASK_SCHEMAS.get(task)
+    if schema is None:
+        return []
+    try:
+        schema.model_validate(value)
+    except ValidationError as e:
+        return [
+            f"{'.'.join(str(p) for p in err['loc']) or '<root>'}: {err['msg']}"
+            for err in e.errors()
+        ]
+    return []
@@ -0,0 +1,117 @@
+"""
+AdmissionController under a synthetic burst: priority order, per-user round
+robin, shedding, per-user caps, the shed/cancel race, and the 429 the API
+returns for a rejection.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from admission import ANONYMOUS, HIGH, LOW, NORMAL, AdmissionController, AdmissionRejected
+
+
+async def _burst(ctl: AdmissionController, calls: List[Tuple[str, int]]) -> List[str]:
+    """Queue `calls` (user, priority) behind one held slot; return grant order."""
+    order: List[str] = []
+    blocker = await ctl.acquire("blocker", NORMAL, 1)
+
+    async def call(user: str, priority: int) -> None:
+        ticket = await ctl.acquire(user, priority, 1)
+        order.append(user)
+        await asyncio.sleep(0)
+        ctl.release(ticket, 0.01)
+
+    tasks = []
+    for user, priority in calls:
+        tasks.append(asyncio.create_task(call(user, priority)))
+        await asyncio.sleep(0)  # enqueue in this order
+    ctl.release(blocker, 0.01)
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_priority_classes_and_round_robin() -> None:
+    async def run() -> List[str]:
+        ctl = AdmissionController(max_concurrency=1, max_queue=64, max_queue_per_user=8)
+        calls = [("noisy", LOW)] * 4 + [("quiet", LOW)] + [("rep", NORMAL)] * 2 + [("safety", HIGH)]
+        return await _burst(ctl, calls)
+
+    order = asyncio.run(run())
+    assert order[0] == "safety"
+    assert order[1:3] == ["rep", "rep"]
+    # quiet's single call is served second in the LOW class, not after all of noisy's.
+    assert order[3:] == ["noisy", "quiet", "noisy", "noisy", "noisy"]
+
+
+def test_full_queue_sheds_lower_class() -> None:
+    async def run() -> None:
+        ctl = AdmissionController(max_concurrency=1, max_queue=2, max_queue_per_user=8, queue_timeout_s=2)
+        held = await ctl.acquire("blocker", NORMAL, 1)
+        low = [asyncio.create_task(ctl.acquire("noisy", LOW, 1)) for _ in range(2)]
+        await asyncio.sleep(0)
+        high = asyncio.create_task(ctl.acquire("safety", HIGH, 1))
+        await asyncio.sleep(0)
+        assert ctl.counters["shed"] == 1
+        with pytest.raises(AdmissionRejected) as rejected:
+            await low[1]  # newest LOW waiter of the user with the most
+        assert rejected.value.retry_after >= 1
+
+        with pytest.raises(AdmissionRejected, match="queue full"):
+            await ctl.acquire("late", LOW, 1)
+
+        ctl.release(held, 0.01)
+        ctl.release(await high, 0.01)
+        ctl.release(await low[0], 0.01)
+        assert ctl.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_per_user_cap_but_not_for_anonymous() -> None:
+    async def run() -> None:
+        ctl = AdmissionController(max_concurrency=1, max_queue=64, max_queue_per_user=1, queue_timeout_s=0.05)
+        held = await ctl.acquire("blocker", NORMAL, 1)
+        waiters = [asyncio.create_task(ctl.acquire(ANONYMOUS, NORMAL, 1)) for _ in range(3)]
+        waiters.append(asyncio.create_task(ctl.acquire("rep", NORMAL, 1)))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected, match="for this user"):
+            await ctl.acquire("rep", NORMAL, 1)
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        # All four queued (and then timed out); none was refused for its user share.
+        assert all(isinstance(r, AdmissionRejected) and "deadline" in r.reason for r in results)
+        assert ctl.counters["rejected_user_share"] == 1
+        ctl.release(held, 0.01)
+        assert ctl.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_shed_and_cancelled_in_same_iteration_keeps_in_flight() -> None:
+    async def run() -> None:
+        ctl = AdmissionController(max_concurrency=1, max_queue=8, max_queue_per_user=8)
+        held = await ctl.acquire("blocker", NORMAL, 1)
+        waiter = asyncio.create_task(ctl.acquire("u", LOW, 1))
+        await asyncio.sleep(0)
+        waiter.cancel()  # the caller goes away...
+        assert ctl._shed_below(HIGH)  # ...and the waiter is shed before it runs again
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert ctl.in_flight == 1
+        ctl.release(held, 0.01)
+        assert ctl.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_rejection_is_429_with_retry_after() -> None:
+    main = pytest.importorskip("main")
+
+    async def run() -> None:
+        response = await main.admission_rejected_handler(None, AdmissionRejected("LLM queue full", 7))
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+
+    asyncio.run(run())
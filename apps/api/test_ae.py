@@ -0,0 +1,15 @@
+"""Parity checks for scan_ae over AE_EXAMPLES."""
+from __future__ import annotations
+
+import pytest
+
+from ae import AE_EXAMPLES, detect_ae, scan_ae
+
+
+@pytest.mark.parametrize("example", AE_EXAMPLES, ids=lambda e: e["text"][:40])
+def test_ae_examples(example: dict) -> None:
+    hits = scan_ae(example["text"])
+    assert [hit.term for hit in hits] == example["terms"]
+    assert detect_ae(example["text"]) is example["expected"]
+    for hit in hits:
+        assert example["text"][hit.start : hit.end].lower() == hit.term
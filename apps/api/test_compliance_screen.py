@@ -0,0 +1,12 @@
+"""Rule pre-screen decisions over SCREEN_EXAMPLES."""
+from __future__ import annotations
+
+import pytest
+
+from compliance_screen import SCREEN_EXAMPLES, screen
+
+
+@pytest.mark.parametrize("example", SCREEN_EXAMPLES, ids=lambda e: str(e["call_report"])[:40])
+def test_screen_examples(example: dict) -> None:
+    result = screen(example["call_report"])
+    assert result.short_circuit is example["short_circuit"], result.issues
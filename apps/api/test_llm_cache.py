@@ -0,0 +1,151 @@
+"""
+LLMCache across workers: two caches sharing one (fake) Postgres, checking
+that invalidate_task in one reaches the other's memory tier, and that a
+short caller deadline does not back off the persistent tier.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from llm_cache import LLMCache
+
+
+class FakeDB:
+    """The two tables LLMCache touches, keyed like the real ones."""
+
+    def __init__(self) -> None:
+        self.generations: Dict[str, int] = {}
+        self.lookups = 0
+        self.lookup_delay_s = 0.0
+
+
+class FakeCursor:
+    def __init__(self, db: FakeDB) -> None:
+        self.db = db
+        self.rowcount = 0
+        self._rows: List[Tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def execute(self, sql: str, params: Optional[Tuple[Any, ...]] = None) -> None:
+        statement = " ".join(sql.split())
+        if statement.startswith("SELECT task, generation"):
+            self._rows = list(self.db.generations.items())
+        elif statement.startswith("SELECT task, response_json"):
+            self.db.lookups += 1
+            await asyncio.sleep(self.db.lookup_delay_s)
+            self._rows = []
+        elif statement.startswith("INSERT INTO llm_cache_generation"):
+            assert params is not None
+            task = params[0]
+            self.db.generations[task] = self.db.generations.get(task, 0) + 1
+            self._rows = [(self.db.generations[task],)]
+        else:  # DELETE / INSERT INTO llm_cache
+            self._rows = []
+
+    async def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self._rows
+
+    async def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self._rows[0] if self._rows else None
+
+
+class FakeConnection:
+    def __init__(self, db: FakeDB) -> None:
+        self.db = db
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self.db)
+
+    async def execute(self, sql: str, params: Optional[Tuple[Any, ...]] = None) -> None:
+        await FakeCursor(self.db).execute(sql, params)
+
+
+class FakePool:
+    def __init__(self, db: FakeDB) -> None:
+        self.db = db
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[FakeConnection]:
+        yield FakeConnection(self.db)
+
+
+def _worker() -> LLMCache:
+    return LLMCache(100, {"precall": 3600, "expense": 900}, 60, generation_check_s=0)
+
+
+async def _settle(*caches: LLMCache) -> None:
+    for cache in caches:
+        if cache._background:
+            await asyncio.gather(*cache._background)
+
+
+def test_first_invalidation_reaches_other_worker() -> None:
+    async def run() -> None:
+        pool = FakePool(FakeDB())
+        a, b = _worker(), _worker()
+        await b.get(pool, "warmup")  # b has polled: no generations yet
+        await _settle(a, b)
+        await b.put(pool, "k1", "precall", "h", {"brief": 1}, 10)
+        await b.put(pool, "k2", "expense", "h", {"expense": 1}, 10)
+        await _settle(b)
+
+        await a.invalidate_task(pool, "precall")  # first invalidation ever
+
+        await b.get(pool, "other")  # triggers b's poll
+        await _settle(b)
+        assert b.counters["generation_invalidations"] == 1
+        assert await b.get(pool, "k1") is None
+        assert await b.get(pool, "k2") == {"expense": 1}
+
+    asyncio.run(run())
+
+
+def test_invalidate_all_reaches_other_worker() -> None:
+    async def run() -> None:
+        pool = FakePool(FakeDB())
+        a, b = _worker(), _worker()
+        await b.put(pool, "k1", "precall", "h", {"brief": 1}, 10)
+        await b.get(pool, "k1")
+        await _settle(a, b)
+
+        await a.invalidate_task(pool)
+
+        await b.get(pool, "other")
+        await _settle(b)
+        assert await b.get(pool, "k1") is None
+        # The invalidating worker doesn't count its own bump as a peer's.
+        await a.get(pool, "other")
+        await _settle(a)
+        assert a.counters["generation_invalidations"] == 0
+
+    asyncio.run(run())
+
+
+def test_short_deadline_skips_persistent_tier_without_backoff() -> None:
+    async def run() -> None:
+        db = FakeDB()
+        pool = FakePool(db)
+        cache = LLMCache(100, {}, 60, lookup_timeout_s=0.05, generation_check_s=3600)
+
+        assert await cache.get(pool, "k", timeout_s=0.0) is None
+        assert db.lookups == 0
+        assert cache._persistent_down_until == 0.0
+
+        assert await cache.get(pool, "k", timeout_s=5.0) is None
+        assert db.lookups == 1
+
+        db.lookup_delay_s = 0.2  # the table itself is slow: back off
+        assert await cache.get(pool, "k") is None
+        assert cache.counters["persistent_timeouts"] == 1
+        assert cache._persistent_down_until > 0.0
+        await cache.get(pool, "k")
+        assert db.lookups == 2
+
+    asyncio.run(run())
@@ -0,0 +1,21 @@
+"""Recall/precision spot checks over REDACTION_EXAMPLES, batch and streamed."""
+from __future__ import annotations
+
+import pytest
+
+from redact import REDACTION_EXAMPLES, StreamRedactor, find_phi, redact
+
+
+@pytest.mark.parametrize("example", REDACTION_EXAMPLES, ids=lambda e: e["text"][:40])
+def test_redaction_examples(example: dict) -> None:
+    assert sorted(span.kind for span in find_phi(example["text"])) == sorted(example["expected"])
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64])
+def test_stream_matches_batch(chunk: int) -> None:
+    text = " ".join(example["text"] for example in REDACTION_EXAMPLES)
+    stream = StreamRedactor()
+    out = "".join(stream.feed(text[i : i + chunk]) for i in range(0, len(text), chunk)) + stream.close()
+    batch = redact(text)
+    assert out == batch.text
+    assert stream.spans == batch.spans
@@ -0,0 +1,13 @@
+-- Shared LLM response cache (content-addressed, per-task TTL)
+CREATE TABLE IF NOT EXISTS llm_cache (
+  cache_key     TEXT PRIMARY KEY,
+  task          TEXT NOT NULL,
+  prompt_hash   TEXT NOT NULL,
+  response_json JSONB NOT NULL,
+  latency_ms    INTEGER,
+  created_at    TIMESTAMPTZ DEFAULT NOW(),
+  expires_at    TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS llm_cache_task_prompt_idx ON llm_cache (task, prompt_hash);
+CREATE INDEX IF NOT EXISTS llm_cache_expires_idx ON llm_cache (expires_at);
@@ -0,0 +1,2 @@
+-- Config each draft was validated against, so PATCH /drafts can re-check fields
+ALTER TABLE call_drafts ADD COLUMN IF NOT EXISTS required_fields_config JSONB;
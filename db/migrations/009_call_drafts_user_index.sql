@@ -0,0 +1,3 @@
+-- Keyset pagination for GET /users/{user_id}/drafts (newest first)
+CREATE INDEX IF NOT EXISTS call_drafts_user_updated_idx
+  ON call_drafts (user_id, updated_at DESC, draft_id DESC);
@@ -0,0 +1,9 @@
+-- Work leasing for parallel sync workers: a worker claims rows by setting
+-- leased_by / lease_expires_at (FOR UPDATE SKIP LOCKED); expired leases are
+-- claimable again.
+ALTER TABLE sync_status ADD COLUMN IF NOT EXISTS leased_by TEXT;
+ALTER TABLE sync_status ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS sync_status_pending_idx
+  ON sync_status (lease_expires_at)
+  WHERE status != 'synced';
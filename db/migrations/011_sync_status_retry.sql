@@ -0,0 +1,14 @@
+-- Retry backoff and dead-lettering for the sync worker: failed events wait
+-- until next_attempt_at; after SYNC_MAX_ATTEMPTS (or a permanent error) they
+-- move to status 'dead' and are only retried when requeued
+-- (worker/dead_letters.py).
+ALTER TABLE sync_status ADD COLUMN IF NOT EXISTS attempts INT NOT NULL DEFAULT 0;
+ALTER TABLE sync_status ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ;
+
+DROP INDEX IF EXISTS sync_status_pending_idx;
+CREATE INDEX IF NOT EXISTS sync_status_due_idx
+  ON sync_status (next_attempt_at)
+  WHERE status NOT IN ('synced', 'dead');
+CREATE INDEX IF NOT EXISTS sync_status_dead_idx
+  ON sync_status (updated_at DESC)
+  WHERE status = 'dead';
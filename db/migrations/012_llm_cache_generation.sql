@@ -0,0 +1,8 @@
+-- Per-task invalidation generation for the LLM cache. Bumped by
+-- POST /diagnostics/llm_cache/invalidate; every API worker polls it and drops
+-- its in-memory entries for a task whose generation changed ('*' = all tasks).
+CREATE TABLE IF NOT EXISTS llm_cache_generation (
+  task        TEXT PRIMARY KEY,
+  generation  BIGINT NOT NULL DEFAULT 0,
+  updated_at  TIMESTAMPTZ DEFAULT NOW()
+);
@@ -0,0 +1,7 @@
+-- Catalog versions published through PUT /catalogs/{catalog_version}.
+-- Immutable per version; every API worker loads a version on first use.
+CREATE TABLE IF NOT EXISTS product_catalogs (
+  catalog_version TEXT PRIMARY KEY,
+  catalog_json    JSONB NOT NULL,
+  created_at      TIMESTAMPTZ DEFAULT NOW()
+);
@@ -0,0 +1,9 @@
+-- Generation claims for /callreport: the API process that inserts (or takes
+-- over an expired) row for an idempotency key is the only one that calls the
+-- model for it; others wait for the stored report. Rows are deleted once the
+-- report is written or generation fails.
+CREATE TABLE IF NOT EXISTS call_report_claims (
+  idempotency_key TEXT PRIMARY KEY,
+  claimed_by      TEXT NOT NULL,
+  expires_at      TIMESTAMPTZ NOT NULL
+);
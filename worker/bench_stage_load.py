@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Client-side cost of the two Snowflake load modes for one batch: merge_batch
+(multi-row INSERT + MERGE) vs load_batch_via_stage (NDJSON/gzip + PUT +
+COPY INTO + MERGE).
+
+    python bench_stage_load.py [--events 200] [--payload-kb 1.5] [--runs 50]
+
+The Snowflake connection only records the SQL it is sent and a local
+directory stands in for the stage, so this measures what the worker builds
+and sends per batch (events/s, statements, SQL bytes, file bytes), not
+warehouse-side load time.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+import uuid
+from typing import Any
+
+from sync_to_snowflake import LocalDirUploader, _merge_params, load_batch_via_stage, merge_batch
+
+
+class RecordingCursor:
+    def __init__(self, sent: list[str]) -> None:
+        self.sent = sent
+
+    def __enter__(self) -> "RecordingCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.sent.append(sql)
+
+    def executemany(self, sql: str, seq: list[dict[str, Any]]) -> None:
+        # The connector rewrites this into one INSERT with every row inlined.
+        head = sql.split(" VALUES ")[0]
+        self.sent.append(f"{head} VALUES " + ", ".join(repr(tuple(params.values())) for params in seq))
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self.sent)
+
+
+def make_batch(events: int, payload_kb: float) -> list[dict[str, Any]]:
+    payload = {
+        "notes_summary": "x" * int(payload_kb * 1024),
+        "products_discussed": [{"name": "P", "messages": ["a", "b"]}],
+        "compliance": {"phi_detected": False},
+    }
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        _merge_params((uuid.uuid4(), "CALL_REPORT_SUBMITTED", payload, "u1", "h1", now, f"bench-{i}"))
+        for i in range(events)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure per-batch client cost of the sync load modes")
+    parser.add_argument("--events", type=int, default=200, help="Events per batch (default 200)")
+    parser.add_argument("--payload-kb", type=float, default=1.5, help="Notes size per event in KB (default 1.5)")
+    parser.add_argument("--runs", type=int, default=50, help="Batches loaded per mode (default 50)")
+    args = parser.parse_args()
+
+    batch = make_batch(args.events, args.payload_kb)
+    with tempfile.TemporaryDirectory(prefix="stage_bench_") as stage_dir:
+        uploader = LocalDirUploader(stage_dir)
+        modes = {
+            "merge": merge_batch,
+            "stage": lambda conn, prefix, rows: load_batch_via_stage(conn, prefix, rows, uploader),
+        }
+        for label, load in modes.items():
+            conn = RecordingConnection()
+            started = time.perf_counter()
+            for _ in range(args.runs):
+                conn.sent.clear()
+                load(conn, "CALL", batch)
+            elapsed = time.perf_counter() - started
+
+            statements = len(conn.sent)
+            file_bytes = 0
+            if label == "stage":
+                statements += 1  # the PUT, which LocalDirUploader stands in for
+                files = os.listdir(stage_dir)
+                file_bytes = sum(os.path.getsize(os.path.join(stage_dir, f)) for f in files) // len(files)
+            sql_bytes = sum(len(sql.encode("utf-8")) for sql in conn.sent)
+            print(
+                f"{label:<6} {args.runs * args.events / elapsed:10,.0f} events/s  "
+                f"{statements} statements/batch  SQL {sql_bytes:10,} B/batch  file {file_bytes:8,} B/batch"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Per-event mark_sync_status vs batched mark_sync_statuses against a real
+Postgres. Runs in a throwaway schema with db/migrations applied and drops it
+afterwards.
+
+    POSTGRES_DSN=postgresql://... python bench_sync_status.py [--events 200] [--runs 5]
+
+Each run writes --events outcomes (one in ten failed) both ways, on fresh
+rows, and the best run of each is reported.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from pathlib import Path
+
+import psycopg
+
+from sync_to_snowflake import POSTGRES_DSN, mark_sync_status, mark_sync_statuses
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "db" / "migrations"
+
+
+def create_schema() -> str:
+    name = f"status_bench_{uuid.uuid4().hex[:12]}"
+    with psycopg.connect(POSTGRES_DSN, autocommit=True) as conn:
+        conn.execute(f"CREATE SCHEMA {name}")
+        conn.execute(f"SET search_path TO {name}")
+        for migration in sorted(MIGRATIONS.glob("*.sql")):
+            conn.execute(migration.read_text())
+    return name
+
+
+def seed(conn: psycopg.Connection, count: int) -> list[str]:
+    """`count` new events with pending sync_status rows; returns their ids."""
+    tag = uuid.uuid4().hex
+    rows = conn.execute(
+        """
+        WITH inserted AS (
+          INSERT INTO events_raw (event_type, payload_json, idempotency_key)
+          SELECT 'CALL_REPORT_CREATED', '{}'::jsonb, %s || '-' || i
+          FROM generate_series(1, %s) AS i
+          RETURNING event_id
+        )
+        INSERT INTO sync_status (event_id) SELECT event_id FROM inserted RETURNING event_id::text
+        """,
+        (tag, count),
+    ).fetchall()
+    conn.commit()
+    return [row[0] for row in rows]
+
+
+def outcomes(event_ids: list[str]) -> list[tuple[str, str, str | None]]:
+    return [
+        (event_id, "failed", "simulated MERGE error") if i % 10 == 0 else (event_id, "synced", None)
+        for i, event_id in enumerate(event_ids)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure sync_status outcome writes")
+    parser.add_argument("--events", type=int, default=200, help="Outcomes per run (default 200)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs; the best one is reported (default 5)")
+    args = parser.parse_args()
+
+    schema = create_schema()
+    best = {"per-event": float("inf"), "batched": float("inf")}
+    try:
+        with psycopg.connect(POSTGRES_DSN, options=f"-c search_path={schema}") as conn:
+            for _ in range(args.runs):
+                batch = outcomes(seed(conn, args.events))
+                started = time.perf_counter()
+                for outcome in batch:
+                    mark_sync_status(conn, *outcome)
+                best["per-event"] = min(best["per-event"], time.perf_counter() - started)
+
+                batch = outcomes(seed(conn, args.events))
+                started = time.perf_counter()
+                mark_sync_statuses(conn, batch)
+                best["batched"] = min(best["batched"], time.perf_counter() - started)
+
+            counts = dict(conn.execute("SELECT status, count(*) FROM sync_status GROUP BY status").fetchall())
+    finally:
+        with psycopg.connect(POSTGRES_DSN, autocommit=True) as conn:
+            conn.execute(f"DROP SCHEMA {schema} CASCADE")
+
+    for label, elapsed in best.items():
+        print(f"{label:<9} {args.events} outcomes  {elapsed * 1000:8.1f} ms  {args.events / elapsed:10,.0f} outcomes/s")
+    print(f"rows      {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,41 @@
 """
 Sync unsynced events from Postgres (events_raw + sync_status) to Snowflake.
 Idempotent MERGE on event_id. Marks sync_status 'synced' or 'failed'.
+
+Failed events are retried with exponential backoff (sync_status.attempts,
+next_attempt_at); after SYNC_MAX_ATTEMPTS, or straight away for permanent
+errors such as an unknown event_type, they become 'dead' and are skipped
+until requeued with dead_letters.py.
+
+Each batch is grouped by target table; a group is bulk-inserted into a
+session-temporary staging table and merged with one MERGE (deduped on
+EVENT_ID). If a group's MERGE fails, its events are retried one MERGE at a
+time so each event still gets its own status and error.
+
+Workers lease their batch (sync_status.leased_by / lease_expires_at, claimed
+with FOR UPDATE SKIP LOCKED), so several can run in parallel without
+syncing the same event twice. A crashed worker's rows become claimable
+again when its lease expires.
+
+--load-mode stage (backfills, peak days) writes each group to a gzipped
+NDJSON file instead, uploads it to an internal stage (PUT), COPYs it into
+the staging table and runs the same MERGE. Uploading goes through a
+StageUploader, so a local directory can stand in for the stage in tests.
 Python 3.12 compatible; uses psycopg (v3) + snowflake-connector-python.
 """
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import os
+import shutil
+import socket
 import sys
-from typing import Any
+import tempfile
+import uuid
+from functools import partial
+from typing import Any, Callable, Protocol
 
 import psycopg
 import snowflake.connector
@@ -31,6 +57,14 @@ SNOWFLAKE_PASSWORD = os.getenv("SNOWFLAKE_PASSWORD")
 SNOWFLAKE_WAREHOUSE = os.getenv("SNOWFLAKE_WAREHOUSE")
 SNOWFLAKE_DATABASE = os.getenv("SNOWFLAKE_DATABASE")
 SNOWFLAKE_SCHEMA = os.getenv("SNOWFLAKE_SCHEMA", "REP_ASSISTANT")
+# How long a worker owns the rows it claimed before others may take them.
+SYNC_LEASE_SECONDS = int(os.getenv("SYNC_LEASE_SECONDS", "300"))
+# Retry backoff: base * 2^(attempts - 1) seconds (with jitter), capped.
+SYNC_MAX_ATTEMPTS = int(os.getenv("SYNC_MAX_ATTEMPTS", "8"))
+SYNC_RETRY_BASE_SECONDS = float(os.getenv("SYNC_RETRY_BASE_SECONDS", "30"))
+SYNC_RETRY_MAX_SECONDS = float(os.getenv("SYNC_RETRY_MAX_SECONDS", "3600"))
+# Internal stage for --load-mode stage (default: the user's stage).
+SNOWFLAKE_SYNC_STAGE = os.getenv("SNOWFLAKE_SYNC_STAGE", "@~/rep_assistant_sync")
 # Optional keypair auth (if PASSWORD not set)
 SNOWFLAKE_PRIVATE_KEY_PATH = os.getenv("SNOWFLAKE_PRIVATE_KEY_PATH")
 SNOWFLAKE_PRIVATE_KEY_PASSPHRASE = os.getenv("SNOWFLAKE_PRIVATE_KEY_PASSPHRASE", "")
@@ -41,6 +75,23 @@ TABLE_MAP = {
     "SAFETY": "SAFETY_EVENTS_RAW",
 }
 
+# Per target table: the auxiliary VARIANT columns and the params that fill them.
+AUX_COLUMNS = {
+    "CALL": {"COMPLIANCE": "aux_json", "CITATIONS": "citations"},
+    "EXPENSE": {"POLICY_FLAGS": "aux_json"},
+    "SAFETY": {"MIN_INFO_STATUS": "aux_json"},
+}
+BASE_COLUMNS = {
+    "EVENT_ID": "event_id",
+    "EVENT_TYPE": "event_type",
+    "IDEMPOTENCY_KEY": "idempotency_key",
+    "USER_ID": "user_id",
+    "HCP_ID": "hcp_id",
+    "SOURCE_EVENT_TS": "source_event_ts",
+    "PAYLOAD": "payload",
+}
+VARIANT_COLUMNS = {"PAYLOAD", "COMPLIANCE", "CITATIONS", "POLICY_FLAGS", "MIN_INFO_STATUS"}
+
 MERGE_CALL = """
 MERGE INTO {table} t
 USING (SELECT
@@ -100,6 +151,112 @@ VALUES
 """
 
 
+MERGE_BY_PREFIX = {"CALL": MERGE_CALL, "EXPENSE": MERGE_EXPENSE, "SAFETY": MERGE_SAFETY}
+
+
+def _columns(prefix: str) -> dict[str, str]:
+    return {**BASE_COLUMNS, **AUX_COLUMNS[prefix]}
+
+
+def _stage_table(prefix: str) -> str:
+    return f"{SNOWFLAKE_SCHEMA}.SYNC_STAGE_{prefix}"
+
+
+def create_stage_sql(prefix: str) -> str:
+    # Everything is staged as text; PARSE_JSON / TO_TIMESTAMP_TZ run in the MERGE.
+    cols = ", ".join(f"{c} STRING" for c in _columns(prefix))
+    return f"CREATE TEMPORARY TABLE IF NOT EXISTS {_stage_table(prefix)} ({cols})"
+
+
+def insert_stage_sql(prefix: str) -> str:
+    cols = _columns(prefix)
+    return (
+        f"INSERT INTO {_stage_table(prefix)} ({', '.join(cols)}) "
+        f"VALUES ({', '.join(f'%({p})s' for p in cols.values())})"
+    )
+
+
+def batch_merge_sql(prefix: str, source: str) -> str:
+    """MERGE of every row in `source` (one row per EVENT_ID kept) into the raw table."""
+    cols = list(_columns(prefix))
+    select = []
+    for c in cols:
+        if c in VARIANT_COLUMNS:
+            select.append(f"PARSE_JSON({c}) AS {c}")
+        elif c == "SOURCE_EVENT_TS":
+            select.append(f"TO_TIMESTAMP_TZ({c}) AS {c}")
+        else:
+            select.append(c)
+    return f"""
+MERGE INTO {SNOWFLAKE_SCHEMA}.{TABLE_MAP[prefix]} t
+USING (
+  SELECT {", ".join(select)}
+  FROM {source}
+  QUALIFY ROW_NUMBER() OVER (PARTITION BY EVENT_ID ORDER BY SOURCE_EVENT_TS DESC) = 1
+) s
+ON t.EVENT_ID = s.EVENT_ID
+WHEN NOT MATCHED THEN INSERT
+  ({", ".join(cols)})
+VALUES
+  ({", ".join("s." + c for c in cols)});
+"""
+
+
+def copy_stage_sql(prefix: str, location: str, file_name: str) -> str:
+    return (
+        f"COPY INTO {_stage_table(prefix)} FROM {location} FILES = ('{file_name}') "
+        "FILE_FORMAT = (TYPE = JSON COMPRESSION = GZIP) "
+        "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE"
+    )
+
+
+class StageUploader(Protocol):
+    """Puts a local file on a stage; COPY INTO reads it from `location`."""
+
+    location: str
+
+    def upload(self, path: str) -> str:
+        """Upload `path`; returns the file name on the stage."""
+        ...
+
+
+class SnowflakeStageUploader:
+    def __init__(self, sf_conn: Any, stage: str = SNOWFLAKE_SYNC_STAGE) -> None:
+        self.sf_conn = sf_conn
+        self.location = stage
+
+    def upload(self, path: str) -> str:
+        with self.sf_conn.cursor() as cur:
+            cur.execute(
+                f"PUT 'file://{path}' {self.location} AUTO_COMPRESS = FALSE "
+                "SOURCE_COMPRESSION = GZIP OVERWRITE = TRUE"
+            )
+        return os.path.basename(path)
+
+
+class LocalDirUploader:
+    """Stand-in stage: copies files into a directory (tests, benchmarks)."""
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.location = directory
+
+    def upload(self, path: str) -> str:
+        shutil.copy(path, self.location)
+        return os.path.basename(path)
+
+
+def write_ndjson_gz(prefix: str, batch: list[dict[str, Any]], directory: str) -> str:
+    """One gzipped NDJSON file for the batch, keyed by staging-table column."""
+    cols = _columns(prefix)
+    path = os.path.join(directory, f"{prefix.lower()}_{uuid.uuid4().hex}.ndjson.gz")
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+        for params in batch:
+            f.write(json.dumps({c: params[p] for c, p in cols.items()}, separators=(",", ":")))
+            f.write("\n")
+    return path
+
+
 def _pg_conn() -> psycopg.Connection:
     return psycopg.connect(POSTGRES_DSN)
 
@@ -126,13 +283,34 @@ def _sf_connect() -> snowflake.connector.SnowflakeConnection:
     return snowflake.connector.connect(**kwargs)
 
 
-def _prefix_table(event_type: str) -> str | None:
-    for prefix, table in TABLE_MAP.items():
+def _prefix(event_type: str) -> str | None:
+    for prefix in TABLE_MAP:
         if event_type.upper().startswith(prefix + "_"):
-            return f"{SNOWFLAKE_SCHEMA}.{table}"
+            return prefix
     return None
 
 
+def _prefix_table(event_type: str) -> str | None:
+    prefix = _prefix(event_type)
+    return f"{SNOWFLAKE_SCHEMA}.{TABLE_MAP[prefix]}" if prefix else None
+
+
+def _merge_params(row: tuple) -> dict[str, Any]:
+    event_id, event_type, payload_json, user_id, hcp_id, created_at, idempotency_key = row
+    payload_str = json.dumps(payload_json) if isinstance(payload_json, dict) else (payload_json or "{}")
+    return {
+        "event_id": str(event_id),
+        "event_type": event_type or "",
+        "idempotency_key": idempotency_key,
+        "user_id": user_id,
+        "hcp_id": hcp_id,
+        "source_event_ts": created_at.isoformat() if created_at else None,
+        "payload": payload_str,
+        "aux_json": "{}",
+        "citations": "[]",
+    }
+
+
 def fetch_unsynced(conn: psycopg.Connection, limit: int) -> list[tuple]:
     with conn.cursor() as cur:
         cur.execute(
@@ -141,7 +319,9 @@ def fetch_unsynced(conn: psycopg.Connection, limit: int) -> list[tuple]:
                    e.created_at, e.idempotency_key
             FROM events_raw e
             JOIN sync_status s ON e.event_id = s.event_id
-            WHERE s.status != 'synced'
+            WHERE s.status NOT IN ('synced', 'dead')
+              AND (s.next_attempt_at IS NULL OR s.next_attempt_at <= NOW())
+              AND (s.lease_expires_at IS NULL OR s.lease_expires_at < NOW())
             ORDER BY e.created_at ASC
             LIMIT %s
             """,
@@ -150,36 +330,190 @@ def fetch_unsynced(conn: psycopg.Connection, limit: int) -> list[tuple]:
         return cur.fetchall()
 
 
-def mark_sync_status(
+def claim_unsynced(
     conn: psycopg.Connection,
-    event_id: str,
-    status: str,
-    last_error: str | None = None,
+    limit: int,
+    worker_id: str,
+    lease_seconds: int = SYNC_LEASE_SECONDS,
+) -> list[tuple]:
+    """
+    Lease up to `limit` due unsynced events (not dead, past next_attempt_at,
+    unleased or with an expired lease) to this worker and return them oldest first. Rows another worker is
+    claiming right now are skipped, not waited on; the lease is committed
+    before returning, so row locks are held only for the claim itself.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            WITH claimable AS (
+              SELECT s.event_id
+              FROM sync_status s
+              JOIN events_raw e ON e.event_id = s.event_id
+              WHERE s.status NOT IN ('synced', 'dead')
+                AND (s.next_attempt_at IS NULL OR s.next_attempt_at <= NOW())
+                AND (s.lease_expires_at IS NULL OR s.lease_expires_at < NOW())
+              ORDER BY e.created_at ASC
+              LIMIT %s
+              FOR UPDATE OF s SKIP LOCKED
+            )
+            UPDATE sync_status s
+            SET leased_by = %s, lease_expires_at = NOW() + make_interval(secs => %s)
+            FROM claimable c
+            JOIN events_raw e ON e.event_id = c.event_id
+            WHERE s.event_id = c.event_id
+            RETURNING e.event_id, e.event_type, e.payload_json, e.user_id, e.hcp_id,
+                      e.created_at, e.idempotency_key
+            """,
+            (limit, worker_id, lease_seconds),
+        )
+        rows = cur.fetchall()
+    conn.commit()
+    # RETURNING has no ORDER BY; restore created_at order (NULLs last, as in SQL).
+    return sorted(rows, key=lambda r: (r[5] is None, r[5]))
+
+
+# (event_id, status, last_error) collected during a run, written by mark_sync_statuses.
+# status is 'synced', 'failed' (retried with backoff) or 'dead' (permanent).
+Outcome = tuple[str, str, str | None]
+
+
+def mark_sync_statuses(
+    conn: psycopg.Connection,
+    outcomes: list[Outcome],
+    worker_id: str | None = None,
 ) -> None:
+    """
+    Write a batch of outcomes in one UPDATE and one commit, releasing their
+    leases. A failure counts an attempt and schedules the next one with
+    exponential backoff, or marks the event dead after SYNC_MAX_ATTEMPTS.
+    With `worker_id`, rows whose lease has since passed to another worker
+    are left to that worker.
+    """
+    if not outcomes:
+        return
+    event_ids, statuses, errors = (list(col) for col in zip(*outcomes))
     with conn.cursor() as cur:
         cur.execute(
             """
-            UPDATE sync_status
-            SET status = %s, last_error = %s, updated_at = NOW()
-            WHERE event_id = %s
+            UPDATE sync_status s
+            SET status = CASE
+                  WHEN v.status = 'failed' AND s.attempts + 1 >= %(max_attempts)s THEN 'dead'
+                  ELSE v.status
+                END,
+                attempts = s.attempts + CASE WHEN v.status = 'synced' THEN 0 ELSE 1 END,
+                next_attempt_at = CASE
+                  WHEN v.status = 'failed' THEN NOW() + make_interval(secs => LEAST(
+                    %(max_delay)s, %(base_delay)s * power(2, s.attempts) * (0.8 + 0.4 * random())
+                  ))
+                END,
+                last_error = v.last_error, updated_at = NOW(),
+                leased_by = NULL, lease_expires_at = NULL
+            FROM unnest(%(event_ids)s::uuid[], %(statuses)s::text[], %(errors)s::text[])
+              AS v(event_id, status, last_error)
+            WHERE s.event_id = v.event_id
+              AND (%(worker_id)s::text IS NULL OR s.leased_by = %(worker_id)s::text)
             """,
-            (status, last_error, event_id),
+            {
+                "event_ids": event_ids,
+                "statuses": statuses,
+                "errors": errors,
+                "worker_id": worker_id,
+                "max_attempts": SYNC_MAX_ATTEMPTS,
+                "base_delay": SYNC_RETRY_BASE_SECONDS,
+                "max_delay": SYNC_RETRY_MAX_SECONDS,
+            },
         )
     conn.commit()
 
 
+def mark_sync_status(
+    conn: psycopg.Connection,
+    event_id: str,
+    status: str,
+    last_error: str | None = None,
+) -> None:
+    mark_sync_statuses(conn, [(event_id, status, last_error)])
+
+
+def merge_batch(sf_conn: Any, prefix: str, batch: list[dict[str, Any]]) -> None:
+    """Bulk-insert one table's events into its staging table and MERGE them in one statement."""
+    stage = _stage_table(prefix)
+    with sf_conn.cursor() as cur:
+        cur.execute(create_stage_sql(prefix))
+        cur.execute(f"TRUNCATE TABLE {stage}")
+        # The connector rewrites executemany into one multi-row INSERT.
+        cur.executemany(insert_stage_sql(prefix), batch)
+        cur.execute(batch_merge_sql(prefix, stage))
+
+
+def load_batch_via_stage(
+    sf_conn: Any,
+    prefix: str,
+    batch: list[dict[str, Any]],
+    uploader: StageUploader,
+) -> None:
+    """Write the batch as NDJSON/gzip, upload it, COPY into the staging table, MERGE."""
+    stage = _stage_table(prefix)
+    with tempfile.TemporaryDirectory(prefix="sync_stage_") as tmp:
+        file_name = uploader.upload(write_ndjson_gz(prefix, batch, tmp))
+    with sf_conn.cursor() as cur:
+        cur.execute(create_stage_sql(prefix))
+        cur.execute(f"TRUNCATE TABLE {stage}")
+        cur.execute(copy_stage_sql(prefix, uploader.location, file_name))
+        cur.execute(batch_merge_sql(prefix, stage))
+
+
+def merge_each(
+    sf_conn: Any,
+    prefix: str,
+    batch: list[dict[str, Any]],
+    outcomes: list[Outcome],
+) -> None:
+    """Per-event MERGE, so a bad row fails alone with its own error."""
+    table = f"{SNOWFLAKE_SCHEMA}.{TABLE_MAP[prefix]}"
+    for params in batch:
+        event_id = params["event_id"]
+        try:
+            with sf_conn.cursor() as cur:
+                cur.execute(MERGE_BY_PREFIX[prefix].format(table=table), params)
+            outcomes.append((event_id, "synced", None))
+            print(f"  Synced {event_id} -> {table}")
+        except Exception as e:
+            err_msg = str(e)[:2000]
+            outcomes.append((event_id, "failed", err_msg))
+            print(f"  Failed {event_id}: {err_msg}", file=sys.stderr)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
 def run(
     limit: int,
     dry_run: bool,
+    load_mode: str = "merge",
+    worker_id: str | None = None,
+    lease_seconds: int = SYNC_LEASE_SECONDS,
 ) -> None:
+    worker_id = worker_id or default_worker_id()
+    if not dry_run and (
+        not SNOWFLAKE_ACCOUNT or not SNOWFLAKE_USER or not SNOWFLAKE_WAREHOUSE or not SNOWFLAKE_DATABASE
+    ):
+        # Checked before claiming, so a misconfigured worker leases nothing.
+        print(
+            "Missing SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, SNOWFLAKE_WAREHOUSE, or SNOWFLAKE_DATABASE",
+            file=sys.stderr,
+        )
+        sys.exit(1)
     pg = _pg_conn()
     try:
-        rows = fetch_unsynced(pg, limit)
+        # A dry run only looks; it must not take rows away from real workers.
+        rows = fetch_unsynced(pg, limit) if dry_run else claim_unsynced(pg, limit, worker_id, lease_seconds)
         if not rows:
             print("No unsynced events.")
             return
 
-        print(f"Found {len(rows)} unsynced event(s). Dry run={dry_run}.")
+        print(f"Found {len(rows)} unsynced event(s). Dry run={dry_run}. Load mode={load_mode}. Worker={worker_id}.")
 
         if dry_run:
             for row in rows:
@@ -188,57 +522,41 @@ def run(
                 print(f"  [dry-run] would MERGE {event_id} ({event_type}) -> {table}")
             return
 
-        if not SNOWFLAKE_ACCOUNT or not SNOWFLAKE_USER or not SNOWFLAKE_WAREHOUSE or not SNOWFLAKE_DATABASE:
-            print(
-                "Missing SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, SNOWFLAKE_WAREHOUSE, or SNOWFLAKE_DATABASE",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+        outcomes: list[Outcome] = []
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            params = _merge_params(row)
+            prefix = _prefix(params["event_type"])
+            if not prefix:
+                print(f"  Dead-letter {params['event_id']}: unknown event_type prefix '{row[1]}'")
+                # No retry can fix this; dead-letter it until the type is mapped and it is requeued.
+                outcomes.append((params["event_id"], "dead", f"Unknown event_type: {row[1]}"))
+                continue
+            groups.setdefault(prefix, []).append(params)
 
-        sf_conn = _sf_connect()
         try:
-            for row in rows:
-                event_id, event_type, payload_json, user_id, hcp_id, created_at, idempotency_key = row
-                event_id_str = str(event_id)
-                table = _prefix_table(event_type or "")
-                if not table:
-                    print(f"  Skip {event_id_str}: unknown event_type prefix '{event_type}'")
-                    mark_sync_status(pg, event_id_str, "failed", f"Unknown event_type: {event_type}")
-                    continue
-
-                payload_str = json.dumps(payload_json) if isinstance(payload_json, dict) else (payload_json or "{}")
-                source_ts = created_at.isoformat() if created_at else None
-                params = {
-                    "event_id": event_id_str,
-                    "event_type": event_type or "",
-                    "idempotency_key": idempotency_key,
-                    "user_id": user_id,
-                    "hcp_id": hcp_id,
-                    "source_event_ts": source_ts,
-                    "payload": payload_str,
-                    "aux_json": "{}",
-                    "citations": "[]",
-                }
-
+            sf_conn = _sf_connect()
+        except Exception:
+            mark_sync_statuses(pg, outcomes, worker_id)
+            raise
+        try:
+            load: Callable[[Any, str, list[dict[str, Any]]], None] = merge_batch
+            if load_mode == "stage":
+                load = partial(load_batch_via_stage, uploader=SnowflakeStageUploader(sf_conn))
+            for prefix, batch in groups.items():
+                table = f"{SNOWFLAKE_SCHEMA}.{TABLE_MAP[prefix]}"
                 try:
-                    with sf_conn.cursor() as cur:
-                        if event_type and event_type.upper().startswith("CALL_"):
-                            cur.execute(MERGE_CALL.format(table=table), params)
-                        elif event_type and event_type.upper().startswith("EXPENSE_"):
-                            cur.execute(MERGE_EXPENSE.format(table=table), params)
-                        elif event_type and event_type.upper().startswith("SAFETY_"):
-                            cur.execute(MERGE_SAFETY.format(table=table), params)
-                        else:
-                            mark_sync_status(pg, event_id_str, "failed", f"Unknown event_type: {event_type}")
-                            continue
-                    mark_sync_status(pg, event_id_str, "synced")
-                    print(f"  Synced {event_id_str} -> {table}")
+                    load(sf_conn, prefix, batch)
                 except Exception as e:
-                    err_msg = str(e)[:2000]
-                    mark_sync_status(pg, event_id_str, "failed", err_msg)
-                    print(f"  Failed {event_id_str}: {err_msg}", file=sys.stderr)
+                    print(f"  Batch MERGE into {table} failed ({str(e)[:200]}); retrying per event", file=sys.stderr)
+                    merge_each(sf_conn, prefix, batch, outcomes)
+                    continue
+                outcomes.extend((params["event_id"], "synced", None) for params in batch)
+                print(f"  Synced {len(batch)} event(s) -> {table}")
         finally:
             sf_conn.close()
+            # Whatever was loaded before an error is still recorded.
+            mark_sync_statuses(pg, outcomes, worker_id)
     finally:
         pg.close()
 
@@ -247,8 +565,27 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Sync events from Postgres to Snowflake")
     parser.add_argument("--dry-run", action="store_true", help="Do not write to Snowflake; mark as synced in Postgres for testing")
     parser.add_argument("--limit", type=int, default=200, help="Max events per run (default 200)")
+    parser.add_argument(
+        "--load-mode",
+        choices=("merge", "stage"),
+        default="merge",
+        help="merge: bulk INSERT + MERGE per table (default); stage: NDJSON/gzip + PUT + COPY INTO, then MERGE",
+    )
+    parser.add_argument("--worker-id", default=None, help="Lease owner name (default hostname:pid)")
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=SYNC_LEASE_SECONDS,
+        help=f"How long claimed events stay leased to this worker (default {SYNC_LEASE_SECONDS})",
+    )
     args = parser.parse_args()
-    run(limit=args.limit, dry_run=args.dry_run)
+    run(
+        limit=args.limit,
+        dry_run=args.dry_run,
+        load_mode=args.load_mode,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+"""
+Concurrent claim_unsynced against a real Postgres: N workers claiming at
+once must never lease the same event twice, and a crashed worker's events
+go to the next worker once its lease expires. Runs in a throwaway schema with
+db/migrations applied; skipped unless POSTGRES_DSN is set.
+
+    POSTGRES_DSN=postgresql://... python -m pytest worker/test_claim_unsynced.py
+"""
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+if not os.getenv("POSTGRES_DSN"):
+    pytest.skip("POSTGRES_DSN not set", allow_module_level=True)
+
+import psycopg
+
+from sync_to_snowflake import POSTGRES_DSN, claim_unsynced, mark_sync_statuses
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "db" / "migrations"
+WORKERS = 8
+EVENTS = 500
+BATCH = 7
+
+
+@pytest.fixture
+def schema():
+    name = f"claim_test_{uuid.uuid4().hex[:12]}"
+    with psycopg.connect(POSTGRES_DSN, autocommit=True) as conn:
+        conn.execute(f"CREATE SCHEMA {name}")
+        conn.execute(f"SET search_path TO {name}")
+        for migration in sorted(MIGRATIONS.glob("*.sql")):
+            conn.execute(migration.read_text())
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO events_raw (event_type, payload_json, idempotency_key)
+                SELECT 'CALL_REPORT_CREATED', '{}'::jsonb, 'claim-test-' || i
+                FROM generate_series(1, %s) AS i
+                """,
+                (EVENTS,),
+            )
+            cur.execute("INSERT INTO sync_status (event_id) SELECT event_id FROM events_raw")
+    try:
+        yield name
+    finally:
+        with psycopg.connect(POSTGRES_DSN, autocommit=True) as conn:
+            conn.execute(f"DROP SCHEMA {name} CASCADE")
+
+
+def test_concurrent_claims_do_not_overlap(schema: str) -> None:
+    start = threading.Barrier(WORKERS)
+    claimed: dict[str, list[str]] = {}
+    errors: list[BaseException] = []
+
+    def work(worker_id: str) -> None:
+        ids: list[str] = []
+        try:
+            with psycopg.connect(POSTGRES_DSN, options=f"-c search_path={schema}") as conn:
+                start.wait(timeout=30)
+                while True:
+                    rows = claim_unsynced(conn, BATCH, worker_id)
+                    if not rows:
+                        break
+                    ids.extend(str(row[0]) for row in rows)
+        except BaseException as e:  # surfaced in the main thread
+            start.abort()  # don't leave the others waiting at the barrier
+            errors.append(e)
+        claimed[worker_id] = ids
+
+    threads = [threading.Thread(target=work, args=(f"worker-{i}",)) for i in range(WORKERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors, errors
+    all_ids = [event_id for ids in claimed.values() for event_id in ids]
+    assert len(all_ids) == len(set(all_ids)), "an event was claimed by two workers"
+    assert len(all_ids) == EVENTS
+
+    with psycopg.connect(POSTGRES_DSN, options=f"-c search_path={schema}") as conn:
+        rows = conn.execute("SELECT event_id::text, leased_by FROM sync_status").fetchall()
+    owner = {event_id: leased_by for event_id, leased_by in rows}
+    for worker_id, ids in claimed.items():
+        assert all(owner[event_id] == worker_id for event_id in ids)
+
+
+def test_expired_lease_is_reclaimed(schema: str) -> None:
+    with psycopg.connect(POSTGRES_DSN, options=f"-c search_path={schema}") as conn:
+        first = claim_unsynced(conn, BATCH, "worker-a")
+        assert len(first) == BATCH
+        # Still leased: worker-b gets the next events, not these.
+        assert not {row[0] for row in claim_unsynced(conn, BATCH, "worker-b")} & {row[0] for row in first}
+
+        # worker-a "crashes": its lease runs out.
+        conn.execute(
+            "UPDATE sync_status SET lease_expires_at = NOW() - interval '1 second' WHERE leased_by = 'worker-a'"
+        )
+        conn.commit()
+        second = claim_unsynced(conn, BATCH, "worker-c")
+        assert {row[0] for row in second} == {row[0] for row in first}
+
+        # worker-a's late outcome must not overwrite worker-c's lease.
+        mark_sync_statuses(conn, [(str(row[0]), "synced", None) for row in first], "worker-a")
+        rows = conn.execute(
+            "SELECT status, leased_by FROM sync_status WHERE event_id = ANY(%s)", ([row[0] for row in first],)
+        ).fetchall()
+    assert all(leased_by == "worker-c" and status != "synced" for status, leased_by in rows)